@@ -0,0 +1,40 @@
+# QR Code generator
+# Importing the package only builds the Galois Field tables: matplotlib is imported when a code is shown, NumPy the
+# first time the NumPy backend is used, and the command line generator runs with `python -m qrcode`
+# The mask backend is chosen when qrcode.masks is imported and can be changed with qrcode.masks.BACKEND = 'python'
+# The archives, batch, cache and disk cache modules pull in tarfile, zipfile, concurrent.futures, mmap and hashlib,
+# so their names are only imported the first time they are used (see __getattr__)
+
+from importlib import import_module
+
+from .bits import BitBuffer, Symbol, matrix_from_bytes, matrix_to_bytes
+from .core import QRCode, show_code
+from .segments import segment_data, select_segments, select_version
+from .tables import BLACK, WHITE
+from .writers import save, to_pbm, to_pgm, to_png, to_svg
+
+# Module of every name that is imported on first use
+LAZY_NAMES = {
+    'read_frames': 'archives',
+    'write_archive': 'archives',
+    'write_frames': 'archives',
+    'write_tar': 'archives',
+    'write_zip': 'archives',
+    'encode_many': 'batch',
+    'encode_many_parallel': 'batch',
+    'warm_tables': 'batch',
+    'SymbolCache': 'cache',
+    'DiskCache': 'diskcache'
+}
+
+def __getattr__(name):
+    # Imports the module of a lazy name and keeps the name in the package, so this only runs once per name
+    module = LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_NAMES))
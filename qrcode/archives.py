@@ -0,0 +1,155 @@
+import io
+import struct
+import tarfile
+import time
+import zipfile
+from itertools import count
+
+from .writers import WRITERS
+
+
+#region ---- ARCHIVES ----
+# Streams many codes into a single tar or zip archive, or into a stream of length-prefixed files
+# Every code is written as soon as it arrives and then dropped, so the memory does not grow with the number of codes
+# (a zip archive is the exception: it keeps a small directory entry per file until the end)
+# The codes are Symbols or matrices, like the ones returned by QRCode.build, see writers.py for scale and border
+
+def file_names(kind, names=None):
+    # Returns the names of the files: the given ones or 00000000.png, 00000001.png, ...
+    if names is not None:
+        return iter(names)
+    return (f'{i:08d}.{kind}' for i in count())
+
+
+def open_sink(sink):
+    # Returns a binary file object for a path or a file object, and whether it has to be closed here
+    if hasattr(sink, 'write'):
+        return sink, False
+    return open(sink, 'wb'), True
+
+
+def tar_files(entries, sink, compression=''):
+    # Writes (name, bytes) entries to a tar archive in stream mode ('w|'), so the sink does not need to be seekable
+    # compression can be '', 'gz', 'bz2' or 'xz'. Returns the number of files written
+    mtime = int(time.time())
+    file, close = open_sink(sink)
+    written = 0
+    try:
+        with tarfile.open(fileobj=file, mode='w|' + compression) as archive:
+            for name, data in entries:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = mtime
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(data))
+                archive.members.clear() # TarFile keeps every TarInfo it writes, they are only needed for reading
+                written += 1
+    finally:
+        if close:
+            file.close()
+    return written
+
+
+def zip_files(entries, sink, compression=zipfile.ZIP_STORED):
+    # Writes (name, bytes) entries to a zip archive. PNG files are already compressed, so they are stored by default
+    # Returns the number of files written
+    date_time = time.localtime()[:6]
+    file, close = open_sink(sink)
+    written = 0
+    try:
+        with zipfile.ZipFile(file, 'w', compression) as archive:
+            for name, data in entries:
+                info = zipfile.ZipInfo(name, date_time)
+                info.compress_type = compression
+                archive.writestr(info, data)
+                written += 1
+    finally:
+        if close:
+            file.close()
+    return written
+
+
+def frame_files(entries, sink, compression=None):
+    # Writes every (name, bytes) entry as a 4-byte big endian length followed by the bytes, see read_frames
+    # The names are not kept
+    # Returns the number of files written
+    file, close = open_sink(sink)
+    written = 0
+    try:
+        for _, data in entries:
+            file.write(struct.pack('>I', len(data)))
+            file.write(data)
+            written += 1
+    finally:
+        if close:
+            file.close()
+    return written
+
+
+def rendered(codes, kind, scale, border, names=None):
+    # Yields a (name, bytes) entry for every code, rendering them one at a time as they are needed
+    writer = WRITERS[kind]
+    for name, code in zip(file_names(kind, names), codes):
+        yield name, writer(code, scale, border)
+
+
+def write_tar(codes, sink, kind='png', scale=1, border=None, names=None, compression=''):
+    # Writes the codes to a tar archive, see tar_files. Returns the number of codes written
+    return tar_files(rendered(codes, kind, scale, border, names), sink, compression)
+
+
+def write_zip(codes, sink, kind='png', scale=1, border=None, names=None, compression=zipfile.ZIP_STORED):
+    # Writes the codes to a zip archive, see zip_files. Returns the number of codes written
+    return zip_files(rendered(codes, kind, scale, border, names), sink, compression)
+
+
+def write_frames(codes, sink, kind='png', scale=1, border=None):
+    # Writes the codes as length-prefixed files, see frame_files. Returns the number of codes written
+    return frame_files(rendered(codes, kind, scale, border), sink)
+
+
+def read_frames(file):
+    # Yields the files of a stream created by write_frames
+    while True:
+        header = file.read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise ValueError('truncated frame length')
+        length = struct.unpack('>I', header)[0]
+        data = file.read(length)
+        if len(data) < length:
+            raise ValueError(f'truncated frame, expected {length} bytes and got {len(data)}')
+        yield data
+
+
+# Writer and compression for each extension of an archive
+ARCHIVES = {
+    '.tar': (tar_files, ''),
+    '.tar.gz': (tar_files, 'gz'),
+    '.tgz': (tar_files, 'gz'),
+    '.tar.bz2': (tar_files, 'bz2'),
+    '.tar.xz': (tar_files, 'xz'),
+    '.zip': (zip_files, zipfile.ZIP_STORED)
+}
+
+def archive_writer(path):
+    # Returns the writer and compression for the extension of the path. Anything else is written as frames
+    for extension, (write, compression) in ARCHIVES.items():
+        if path.lower().endswith(extension):
+            return write, compression
+    return frame_files, None
+
+
+def write_files(entries, path):
+    # Writes (name, bytes) entries to the archive picked from the extension of the path
+    # Returns the number of files written
+    write, compression = archive_writer(path)
+    return write(entries, path, compression)
+
+
+def write_archive(codes, path, kind='png', scale=1, border=None, names=None):
+    # Renders the codes into the archive picked from the extension of the path. Returns the number of codes written
+    return write_files(rendered(codes, kind, scale, border, names), path)
+
+#endregion
@@ -0,0 +1,112 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from . import masks
+from .bits import matrix_from_bytes, matrix_to_bytes
+from .core import QRCode
+from .galois import precompute_generators, rs_feedback_table
+from .masks import mask_arrays, mask_switches
+from .patterns import placement_order, template_matrix
+from .tables import EC_BLOCKS, VERSIONS_DIMENSIONS
+from .writers import WRITERS
+
+
+def encode_many(payloads, ec_level='L', mode=None, version=None):
+    # Yields the final matrix of each payload, in the same order as the payloads
+    # Generator polynomials, templates, reserved modules, placement orders and mask switches are cached by the module,
+    # so they are built by the first QR Code that needs them and shared by all the others
+    # Nothing is drawn, so matplotlib is never used
+    for data in payloads:
+        yield QRCode(data, mode, version, ec_level).build()
+
+
+def warm_tables(version=None):
+    # Builds the tables shared by every QR Code: all the generator polynomials and shift register feedbacks and, if a
+    # version is given, its template, reserved modules, placement order and mask switches
+    # Other versions are built the first time they are needed and then kept for the life of the process
+    precompute_generators()
+    for n_code in set(entry[0] for row in EC_BLOCKS[1:] for entry in row):
+        rs_feedback_table(n_code)
+
+    if version is not None:
+        template_matrix(version)
+        placement_order(version)
+        mask_switches(version)
+        if masks.BACKEND == 'numpy':
+            mask_arrays(VERSIONS_DIMENSIONS[version])
+
+
+def encode_chunk(payloads, ec_level, mode, version):
+    # Encodes a list of payloads and returns each final matrix as (size, packed bytes), see matrix_to_bytes
+    results = []
+    for matrix in encode_many(payloads, ec_level, mode, version):
+        results.append((len(matrix), matrix_to_bytes(matrix)))
+    return results
+
+
+def map_chunks(function, payloads, args=(), processes=None, chunksize=256, version=None):
+    # Calls function(chunk, *args) in a pool of worker processes for every ´chunksize´ payloads and yields the results
+    # of each chunk in order. Each worker builds the shared tables once, when it starts
+    # At most two chunks per worker are waiting at any time, so the payloads are consumed as the results are yielded
+    payloads = iter(payloads)
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(processes, initializer=warm_tables, initargs=(version,)) as pool:
+        pending = deque()
+        max_pending = 2 * processes
+
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(payloads, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(function, chunk, *args))
+
+            if not pending:
+                return
+
+            yield pending.popleft().result()
+
+
+def encode_many_parallel(payloads, ec_level='L', mode=None, version=None, processes=None, chunksize=256, packed=False):
+    # Same as encode_many, but the payloads are encoded by a pool of worker processes, see map_chunks
+    # The workers send back the matrices packed into bytes
+    # If ´packed´ is True, (size, packed bytes) pairs are yielded instead of the matrices
+    for results in map_chunks(encode_chunk, payloads, (ec_level, mode, version), processes, chunksize, version):
+        for size, data in results:
+            yield (size, data) if packed else matrix_from_bytes(data, size)
+
+
+def render_chunk(payloads, kind, scale, border, ec_level, mode, version):
+    # Builds and renders a list of payloads, see writers.py. Returns the bytes of each file, or the error message
+    # as a str for the payloads that can not be encoded
+    writer = WRITERS[kind]
+    results = []
+    for data in payloads:
+        try:
+            code = QRCode(data, mode, version, ec_level)
+            code.build()
+            results.append(writer(code.symbol(), scale, border))
+        except ValueError as error: # The payload does not fit, or does not suit the given mode
+            results.append(str(error))
+        except Exception as error: # Anything else is reported for this payload too, so the batch goes on
+            results.append(f'{type(error).__name__}: {error}')
+    return results
+
+
+def render_many(payloads, kind='png', scale=1, border=None, ec_level='L', mode=None, version=None, processes=1,
+                chunksize=64):
+    # Yields the file of every payload as bytes (or the error message as a str), in the same order as the payloads
+    # With more than one process the payloads are rendered by a pool of workers, see map_chunks
+    if processes == 1:
+        payloads = iter(payloads)
+        while True:
+            chunk = list(islice(payloads, chunksize))
+            if not chunk:
+                return
+            yield from render_chunk(chunk, kind, scale, border, ec_level, mode, version)
+
+    args = (kind, scale, border, ec_level, mode, version)
+    for results in map_chunks(render_chunk, payloads, args, processes, chunksize, version):
+        yield from results
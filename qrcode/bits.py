@@ -0,0 +1,123 @@
+class BitBuffer():
+    # Sequence of bits packed into a bytearray, most significant bit first
+    # Bits that do not complete a byte yet are kept in an integer accumulator
+
+    def __init__(self):
+        self.data = bytearray() # Complete bytes
+        self.acc = 0 # Pending bits that do not fill a byte yet
+        self.acc_bits = 0 # Number of pending bits (always less than 8)
+
+    def __len__(self):
+        return 8 * len(self.data) + self.acc_bits
+
+    def append_bits(self, value, n):
+        ## Appends the ´n´ least significant bits of ´value´, most significant first
+        if value < 0 or value >> n:
+            raise ValueError(f'{value} does not fit in {n} bits')
+
+        acc = (self.acc << n) | value
+        bits = self.acc_bits + n
+        while bits >= 8:
+            bits -= 8
+            self.data.append((acc >> bits) & 0xFF)
+
+        self.acc = acc & ((1 << bits) - 1)
+        self.acc_bits = bits
+
+    def append_bytes(self, data):
+        ## Appends every bit of ´data´ (bytes, bytearray or list of integers up to 255)
+        if self.acc_bits == 0:
+            self.data.extend(data)
+        else:
+            for byte in data:
+                self.append_bits(byte, 8)
+
+    def __iter__(self):
+        ## Yields every bit, most significant first
+        length = len(self)
+        for i, byte in enumerate(self.to_bytes()):
+            for shift in range(7, max(-1, 8 * i + 7 - length), -1):
+                yield (byte >> shift) & 1
+
+    def to_bytes(self):
+        ## Returns the bits as bytes. The last byte is completed with zeros if needed
+        if self.acc_bits == 0:
+            return bytes(self.data)
+        return bytes(self.data) + bytes([self.acc << (8 - self.acc_bits)])
+
+
+# Translation tables between modules (0 and 1) and the characters '0' and '1'
+MODULES_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+DIGITS_TO_MODULES = bytes.maketrans(b'01', b'\x00\x01')
+
+def matrix_to_bytes(matrix):
+    # Packs a square matrix of modules into bytes, 8 modules per byte, most significant bit first
+    # Every row starts at a new byte, so it takes (size + 7) // 8 bytes
+    size = len(matrix)
+    stride = (size + 7) // 8
+    pad = 8 * stride - size
+    packed = bytearray()
+    for row in matrix:
+        packed += (int(bytes(row).translate(MODULES_TO_DIGITS), 2) << pad).to_bytes(stride, 'big')
+    return bytes(packed)
+
+
+def matrix_from_bytes(data, size):
+    # Unpacks the bytes created by matrix_to_bytes into a list of rows of modules
+    stride = (size + 7) // 8
+    pad = 8 * stride - size
+    matrix = []
+    for start in range(0, stride * size, stride):
+        value = int.from_bytes(data[start:start + stride], 'big') >> pad
+        matrix.append(list(format(value, f'0{size}b').encode().translate(DIGITS_TO_MODULES)))
+    return matrix
+
+
+class Symbol():
+    # Finished QR Code stored as packed bits, in the same layout as matrix_to_bytes: every row starts at a new byte,
+    # 8 modules per byte, most significant bit first
+    # The function pattern mask uses the same layout and is shared by every symbol of a version, so a cached symbol
+    # only owns (size + 7) // 8 bytes per row instead of a list of Python ints
+    __slots__ = ('size', 'stride', 'data', 'function')
+
+    def __init__(self, size, data=None, function=None):
+        self.size = size
+        self.stride = (size + 7) // 8
+        self.data = bytearray(data) if data is not None else bytearray(self.stride * size)
+        self.function = function # Packed modules of the function patterns, or None if unknown
+        if len(self.data) != self.stride * size:
+            raise ValueError(f'a {size}x{size} symbol takes {self.stride * size} bytes, not {len(self.data)}')
+
+    @classmethod
+    def from_matrix(cls, matrix, function=None):
+        return cls(len(matrix), matrix_to_bytes(matrix), function)
+
+    def get(self, row, column):
+        ## Returns the module at (row, column)
+        return (self.data[row * self.stride + (column >> 3)] >> (7 - (column & 7))) & 1
+
+    def set(self, row, column, value):
+        ## Sets the module at (row, column) to 1 if value is true, to 0 otherwise
+        index = row * self.stride + (column >> 3)
+        bit = 0x80 >> (column & 7)
+        if value:
+            self.data[index] |= bit
+        else:
+            self.data[index] &= ~bit
+
+    def is_function(self, row, column):
+        ## Returns True if the module at (row, column) belongs to a function pattern
+        return self.function is not None and bool((self.function[row * self.stride + (column >> 3)] >> (7 - (column & 7))) & 1)
+
+    def row_bytes(self, row):
+        ## Returns the packed bytes of a row. The bits after the last module are zeros
+        return bytes(self.data[row * self.stride:(row + 1) * self.stride])
+
+    def to_bytes(self):
+        return bytes(self.data)
+
+    def to_matrix(self):
+        return matrix_from_bytes(self.data, self.size)
+
+    def __eq__(self, other):
+        return isinstance(other, Symbol) and self.size == other.size and self.data == other.data
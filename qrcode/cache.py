@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from threading import Lock
+
+from .core import QRCode
+from .writers import WRITERS
+
+
+#region ---- SYMBOL CACHE ----
+# Bounded LRU cache of finished codes, for payloads that are encoded over and over
+# Codes are stored as packed Symbols (see bits.py), keyed by (data, mode, version, EC level, mask), and the rendered
+# files can be cached too, keyed by the code and (kind, scale, border)
+# Nothing is cached unless a SymbolCache is created and used
+
+class SymbolCache():
+    def __init__(self, maxsize=4096, maxrendered=0):
+        # maxsize is the number of symbols kept and maxrendered the number of rendered files (0 to render every time)
+        self.maxsize = maxsize
+        self.maxrendered = maxrendered
+        self.symbols = OrderedDict() # The least recently used entries come first
+        self.rendered = OrderedDict()
+        # Hits, misses and evictions of each dictionary, so a rendered file served from the cache is not counted as a
+        # symbol miss too
+        self.counters = {'symbols': [0, 0, 0], 'rendered': [0, 0, 0]}
+        self.lock = Lock() # Only guards the dictionaries and counters, the codes are encoded outside of it
+
+    def lookup(self, name, key):
+        ## Returns the cached value of the key in the dictionary name and marks it as the most recently used one, or None
+        entries, counters = getattr(self, name), self.counters[name]
+        with self.lock:
+            value = entries.get(key)
+            if value is None:
+                counters[1] += 1
+            else:
+                entries.move_to_end(key)
+                counters[0] += 1
+            return value
+
+    def store(self, name, key, value, maxsize):
+        ## Adds a value to the dictionary name and evicts the least recently used ones beyond maxsize
+        entries, counters = getattr(self, name), self.counters[name]
+        with self.lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+                counters[2] += 1
+
+    def symbol(self, data, mode=None, version=None, ec_level='L', mask=None):
+        # Returns the Symbol of the data, without the quiet zone. The returned Symbol is shared and must not be modified
+        key = (data, mode, version, ec_level, mask)
+        symbol = self.lookup('symbols', key)
+        if symbol is None:
+            code = QRCode(data, mode, version, ec_level, mask)
+            code.build()
+            symbol = code.symbol()
+            if self.maxsize > 0:
+                self.store('symbols', key, symbol, self.maxsize)
+        return symbol
+
+    def get_rendered(self, data, kind='png', scale=1, border=None, mode=None, version=None, ec_level='L', mask=None):
+        # Returns the cached file of the data, or None if it is not cached (or files are not cached at all)
+        if self.maxrendered <= 0:
+            return None
+        return self.lookup('rendered', (data, mode, version, ec_level, mask, kind, scale, border))
+
+    def put_rendered(self, rendered, data, kind='png', scale=1, border=None, mode=None, version=None, ec_level='L',
+                     mask=None):
+        # Caches the file of the data, rendered somewhere else (in a worker process, for example)
+        if self.maxrendered > 0:
+            self.store('rendered', (data, mode, version, ec_level, mask, kind, scale, border), rendered,
+                       self.maxrendered)
+
+    def render(self, data, kind='png', scale=1, border=None, mode=None, version=None, ec_level='L', mask=None):
+        # Returns the file of the data as bytes, see writers.py. The border defaults to the quiet zone
+        rendered = self.get_rendered(data, kind, scale, border, mode, version, ec_level, mask)
+        if rendered is None:
+            rendered = WRITERS[kind](self.symbol(data, mode, version, ec_level, mask), scale, border)
+            self.put_rendered(rendered, data, kind, scale, border, mode, version, ec_level, mask)
+        return rendered
+
+    def stats(self):
+        # Returns the hits, misses, evictions and number of entries of the symbols and of the rendered files
+        with self.lock:
+            return {name: {'hits': hits, 'misses': misses, 'evictions': evictions, 'size': len(getattr(self, name))}
+                    for name, (hits, misses, evictions) in self.counters.items()}
+
+    def clear(self):
+        # Drops every entry. The counters are kept
+        with self.lock:
+            self.symbols.clear()
+            self.rendered.clear()
+
+#endregion
@@ -0,0 +1,204 @@
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from collections import deque
+from itertools import chain
+
+from .archives import ARCHIVES, file_names, frame_files, write_files
+from .batch import render_many
+from .tables import EC_INDEX
+from .writers import WRITERS
+
+
+#region ---- COMMAND LINE ----
+# python -m qrcode [INPUT] [-o OUTPUT] [options]
+# Reads one payload per line (or a column of a CSV file) from INPUT or stdin and writes one image per payload to a
+# directory, to an archive (.tar, .tar.gz, .zip, ...) or as length-prefixed frames to stdout (-o -)
+# The version and the mode are picked for every payload unless they are given
+# Payloads are read, rendered and written as they come, a few chunks at a time, so the memory used does not depend on
+# the size of the input (only the names taken from --name-column are kept, to skip the duplicates)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m qrcode', description='Generates QR Codes in bulk.')
+    parser.add_argument('input', nargs='?', default='-', help='file with one payload per line, - for stdin (default)')
+    parser.add_argument('-o', '--output', default='.',
+                        help='directory, archive (' + ', '.join(ARCHIVES) + ') or - for frames on stdout (default: .)')
+    parser.add_argument('-c', '--column', help='read the input as CSV and take the payloads from this column '
+                                               '(header name, or number starting at 0 when the file has no header)')
+    parser.add_argument('--name-column', help='CSV column with the file names, without extension')
+    parser.add_argument('--delimiter', default=',', help='CSV delimiter (default: ,)')
+    parser.add_argument('-f', '--format', default='png', choices=sorted(WRITERS), help='image format (default: png)')
+    parser.add_argument('-s', '--scale', type=int, default=4, help='pixels per module (default: 4)')
+    parser.add_argument('-b', '--border', type=int, default=4, help='quiet zone in modules (default: 4)')
+    parser.add_argument('-e', '--ec', default='L', choices=list(EC_INDEX), help='error correction level (default: L)')
+    parser.add_argument('--version', type=int, choices=range(1, 41), metavar='1-40',
+                        help='version of every code (default: the smallest that fits each payload)')
+    parser.add_argument('--mode', choices=('Numeric', 'Alphanumeric', 'Byte', 'Kanji'),
+                        help='mode of every code (default: the shortest mix of modes for each payload)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: the number of CPUs)')
+    parser.add_argument('--chunksize', type=int, default=64, help='payloads sent to a worker at a time (default: 64)')
+    parser.add_argument('--show', action='store_true', help='show every code with matplotlib instead of writing it')
+    return parser.parse_args(argv)
+
+
+def column_index(header, column):
+    # Returns the position of a column given by its name or its number
+    if column.isdigit():
+        return int(column)
+    try:
+        return header.index(column)
+    except ValueError:
+        raise SystemExit(f'error: no column {column!r} in the header {header!r}')
+
+
+def report_skipped(message):
+    print(message, file=sys.stderr)
+
+
+def read_lines(stream):
+    # Yields (None, payload) for every non-empty line, the line endings removed
+    for line in stream:
+        line = line.rstrip('\r\n')
+        if line:
+            yield None, line
+
+
+def read_payloads(stream, column=None, name_column=None, delimiter=',', report=report_skipped):
+    # Returns an iterator of (name, payload) pairs. Without a column every non-empty line is a payload
+    # The name is None unless it comes from name_column. Rows without the payload or the name column are passed to
+    # report and skipped. A column that is not in the header (or in the first row, without a header) is an error,
+    # raised right away rather than once the output is opened
+    if column is None:
+        return read_lines(stream)
+
+    reader = csv.reader(stream, delimiter=delimiter)
+    header = None
+    if not column.isdigit() or (name_column is not None and not name_column.isdigit()):
+        header = next(reader, [])
+    index = column_index(header, column)
+    name_index = column_index(header, name_column) if name_column is not None else None
+
+    rows = reader
+    first = header
+    if first is None:
+        first = next(reader, None)
+        if first is not None:
+            rows = chain([first], reader)
+    if first is not None:
+        for name, position in ((column, index), (name_column, name_index)):
+            if position is not None and position >= len(first):
+                where = 'header' if header is not None else 'first row'
+                raise SystemExit(f'error: no column {name!r}, the {where} has {len(first)} columns')
+
+    def pairs():
+        for row in rows:
+            if not row: # Blank line
+                continue
+            if index >= len(row):
+                report(f'line {reader.line_num}: no payload in column {column!r}, skipped')
+                continue
+            if not row[index]:
+                continue
+            if name_index is not None and name_index >= len(row):
+                report(f'line {reader.line_num}: no name in column {name_column!r}, skipped')
+                continue
+            yield (row[name_index] if name_index is not None else None), row[index]
+
+    return pairs()
+
+
+def open_input(path):
+    # Text stream of the input. Newlines are left to the csv module, which needs them untranslated
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def write_directory(entries, directory):
+    # Writes every (name, bytes) entry to a file of the directory. Returns the number of files written
+    os.makedirs(directory, exist_ok=True)
+    written = 0
+    for name, data in entries:
+        with open(os.path.join(directory, name), 'wb') as file:
+            file.write(data)
+        written += 1
+    return written
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.scale < 1 or args.border < 0 or args.jobs < 1 or args.chunksize < 1:
+        raise SystemExit('error: the scale, jobs and chunksize must be at least 1 and the border at least 0')
+
+    errors = 0
+
+    def report(message):
+        nonlocal errors
+        errors += 1
+        report_skipped(message)
+
+    stream = open_input(args.input)
+    pairs = read_payloads(stream, args.column, args.name_column, args.delimiter, report)
+
+    if args.show:
+        from .core import QRCode, show_code # matplotlib is only needed here
+        for _, data in pairs:
+            try:
+                code = QRCode(data, args.mode, args.version, args.ec)
+                matrix = code.build()
+            except ValueError as error:
+                errors += 1
+                print(f'{data!r}: {error}', file=sys.stderr)
+                continue
+            show_code(matrix)
+        return 1 if errors else 0
+
+    # The names wait in a queue until their files come back from the workers. At most a few chunks are in flight,
+    # so the queue stays short
+    # A payload without a name, or with an empty one, takes its running number. Frames on stdout have no names
+    numbers = file_names(args.format)
+    pending_names = deque()
+    used_names = set() if args.name_column is not None and args.output != '-' else None
+
+    def payloads():
+        for name, data in pairs:
+            number = next(numbers)
+            base = os.path.basename(name) if name is not None else ''
+            name = f'{base}.{args.format}' if base else number
+            if used_names is not None:
+                if name in used_names:
+                    report(f'{name}: duplicate name, skipped')
+                    continue
+                used_names.add(name)
+            pending_names.append(name)
+            yield data
+
+    def entries():
+        nonlocal errors
+        for result in render_many(payloads(), args.format, args.scale, args.border, args.ec, args.mode, args.version,
+                                  args.jobs, args.chunksize):
+            name = pending_names.popleft()
+            if isinstance(result, str):
+                errors += 1
+                print(f'{name}: {result}', file=sys.stderr)
+                continue
+            yield name, result
+
+    start = time.perf_counter()
+    if args.output == '-':
+        written = frame_files(entries(), sys.stdout.buffer)
+    elif args.output.lower().endswith(tuple(ARCHIVES)):
+        written = write_files(entries(), args.output)
+    else:
+        written = write_directory(entries(), args.output)
+    stream.close()
+
+    print(f'{written} codes written to {args.output} in {time.perf_counter() - start:.2f}s, {errors} errors',
+          file=sys.stderr)
+    return 1 if errors else 0
+
+#endregion
@@ -0,0 +1,498 @@
+from . import masks
+from .bits import BitBuffer, Symbol
+from .galois import GF_EXP, GF_LOG, generator_poly, rs_encode
+from .masks import (MASK_PATTERNS, format_arrays, format_switches, mask_arrays, mask_scores, mask_switches, numpy_module,
+                    pack_matrix, penalties_numpy, penalty_score)
+from .patterns import format_positions, function_mask, placement_order, reserved_modules, template_matrix
+from .segments import kanji_value, segment_payload, select_segments, select_version
+from .tables import (ALPHANUMERIC_TABLE, CHARACTER_COUNT_BITS, DATA_CODEWORDS, EC_BLOCKS, EC_INDEX, FORMAT_INFO,
+                     MODE_INDICATOR_TABLE, VERSIONS_DIMENSIONS, WHITE, version_class)
+
+
+def show_code(matrix):
+    # matplotlib is only imported when a code is shown, so encoding does not depend on it
+    from matplotlib import pyplot as plt
+    plt.imshow(matrix, interpolation='nearest', cmap='gray_r', vmin=0, vmax=1)
+    plt.show()
+
+
+class QRCode():
+    # Every attribute is declared here, so a QRCode has no __dict__
+    __slots__ = ('segments', 'version', 'data', 'datalen', 'shape', 'buffer', 'ec', 'mode', 'n_eccodewords', 'blocksG1',
+                 'datacodeG1', 'blocksG2', 'datacodeG2', 'totalbits', 'codewords', 'g1', 'g2', 'ec_codewords', 'matrix',
+                 'reserved', 'mask', 'mask_number')
+
+    def __init__(self, data, mode=None, version=None, ec_level='L', mask=None):
+        # If no mode is given, the data is split into segments of different modes using the fewest bits
+        # If no version is given, the smallest one that fits the data is selected
+        # If a mask is given, it is used instead of the one with the lowest penalty score
+        if version is not None and version not in range(1, 41):
+            raise ValueError(f'the version must be a number from 1 to 40, not {version!r}')
+        if ec_level not in EC_INDEX:
+            raise ValueError(f'the error correction level must be one of {", ".join(EC_INDEX)}, not {ec_level!r}')
+        if mask is not None and mask not in range(8):
+            raise ValueError(f'the mask must be a number from 0 to 7, not {mask!r}')
+        if mode is None:
+            version, self.segments = select_segments(data, ec_level, version)
+        else:
+            self.segments = [(mode, segment_payload(mode, data))]
+            if version is None:
+                version = select_version(mode, len(self.segments[0][1]), ec_level)
+            elif select_version(mode, len(self.segments[0][1]), ec_level) > version:
+                raise ValueError(f'the data does not fit in a version {version} QR Code')
+
+        self.version = version # Versio of the QR Code
+        self.data = data # Data to be encoded
+        self.datalen = len(self.segments[0][1]) if mode else len(data) # Lenght of data (in bytes for the Byte mode)
+        self.shape = VERSIONS_DIMENSIONS[self.version] # Dimension of the QR Code
+        self.buffer = BitBuffer() # Bits representing data and error correction
+        self.ec = ec_level # Level of error correction (L, M, Q, H)
+        self.mode = mode # QR Code mode (Alphanumeric, Numeric, ...). None for mixed segments
+        ec_blocks = EC_BLOCKS[self.version][EC_INDEX[self.ec]]
+        self.n_eccodewords = ec_blocks[0] # Number of EC codewords for each block
+        self.blocksG1 = ec_blocks[1] # Number of blocks in group 1
+        self.datacodeG1 = ec_blocks[2] # Number of data codewords for each block of group 1
+        self.blocksG2 = ec_blocks[3] # Number of blocks in group 2
+        self.datacodeG2 = ec_blocks[4] # Number of data codewords for each block of group 2
+        self.totalbits = 8 * DATA_CODEWORDS[self.version][EC_INDEX[self.ec]] # Total bits necessary
+        self.codewords = b'' # Data codewords
+        self.g1 = [] # Blocks of G1 group, as views of the data codewords
+        self.g2 = [] # Blocks of G2 group, as views of the data codewords
+        self.ec_codewords = [] # Error correction codewords
+        self.matrix = [] # Final matrix
+        self.reserved = reserved_modules(self.version) # Bitmap of the modules used by the function patterns
+        self.mask = mask # Mask given by the user, None to evaluate the eight masks
+        self.mask_number = 0
+        self.init_matrix()
+
+
+    def init_matrix(self):
+        # Initializes the matrix as a copy of the template of the version, one bytearray per row
+        template = template_matrix(self.version)
+        self.matrix = [template[i:i + self.shape] for i in range(0, len(template), self.shape)]
+
+
+    #region ---- RAW DATA ENCODING ---- 
+
+    def encode_data(self):
+        ## Appends every segment (mode, character count and data) to the class buffer.
+        for mode, data in self.segments:
+            self.set_mode(mode)
+            self.character_count(mode, len(data))
+            CONVERSIONS[mode](self, data)
+
+    def set_mode(self, mode=None):
+        ## Appends the mode encoding to the class buffer.
+        self.buffer.append_bits(MODE_INDICATOR_TABLE.get(mode or self.mode), 4)
+
+    def character_count(self, mode=None, length=None):
+        ## Appends the character count enoding to the class buffer.
+        mode = mode or self.mode
+        if length is None:
+            length = self.datalen
+
+        self.buffer.append_bits(length, CHARACTER_COUNT_BITS[mode][version_class(self.version)])
+
+
+    def numeric_conversion(self, data=None):
+        ## Encodes the data as groups of three digits.
+
+        if data is None:
+            if self.mode != 'Numeric':
+                return
+            data = self.segments[0][1]
+
+        # Each group of three digits takes 10 bits. A final group of two digits takes 7 bits and a single digit 4 bits
+        for i in range(0, len(data) - 2, 3):
+            self.buffer.append_bits(int(data[i:i + 3]), 10)
+
+        remainder = len(data) % 3
+        if remainder != 0:
+            self.buffer.append_bits(int(data[len(data) - remainder:]), 3 * remainder + 1)
+
+
+    def alpha_conversion(self, data=None):
+        ## Encodes the data according to the alphanumeric table of conversion.
+        
+        if data is None:
+            if self.mode != 'Alphanumeric':
+                return
+            data = self.segments[0][1]
+
+        # Taking pairs of characters and encoding them using the alphanumeric table.
+        for i in range(0, len(data) - 1, 2):
+            value = (45 * ALPHANUMERIC_TABLE.get(data[i]) + ALPHANUMERIC_TABLE.get(data[i + 1]))
+            self.buffer.append_bits(value, 11)
+
+        if len(data) % 2 != 0:
+            value = ALPHANUMERIC_TABLE.get(data[len(data) - 1])
+            self.buffer.append_bits(value, 6)
+
+
+    def byte_conversion(self, data=None):
+        ## Encodes the data as 8-bit bytes. Strings are encoded as UTF-8.
+
+        if data is None:
+            if self.mode != 'Byte':
+                return
+            data = self.segments[0][1]
+
+        self.buffer.append_bytes(data)
+
+
+    def kanji_conversion(self, data=None):
+        ## Encodes the data as 13-bit values of the Shift JIS characters.
+
+        if data is None:
+            if self.mode != 'Kanji':
+                return
+            data = self.segments[0][1]
+
+        for character in data:
+            value = kanji_value(character)
+            if value is None:
+                raise ValueError(f'{character!r} can not be encoded in the Kanji mode')
+            self.buffer.append_bits(value, 13)
+
+
+    def terminator(self):
+        ## Adds terminator bits to the buffer
+
+        bits = len(self.buffer)
+        if bits <=  self.totalbits - 4:
+            self.buffer.append_bits(0, 4)
+
+        else:
+            self.buffer.append_bits(0, self.totalbits - bits)
+
+
+    def padding(self):
+        ## Adds the final padding to make sure the buffer lenght is a multiple of 8
+
+        remainder = len(self.buffer) % 8
+
+        if remainder != 0:
+            self.buffer.append_bits(0, 8 - remainder)
+    
+        ## Filling the remaining bytes by repeating the '11101100 00010001' pair of bytes
+        bytes_to_fill = (self.totalbits - len(self.buffer)) // 8
+        self.buffer.append_bytes(b'\xec\x11' * (bytes_to_fill // 2) + b'\xec' * (bytes_to_fill % 2))
+            
+    #endregion
+
+    #region ---- ERROR CORRECTION -----
+    # The error correction requires data codewords, a generator polynomial and a message polynomial
+    # By dividing the polynomials we get the required codewords
+    
+    def data_codewords(self):
+        ## Generates the blocks and groups of codewords. Blocks are represented by the items in the g1 and g2 arrays
+        ## Every block is a view of self.codewords, so no codeword is copied
+        self.codewords = self.buffer.to_bytes()
+        view = memoryview(self.codewords)
+        start = 0
+        for _ in range(self.blocksG1):
+            self.g1.append(view[start:start + self.datacodeG1])
+            start += self.datacodeG1
+
+        for _ in range(self.blocksG2):
+            self.g2.append(view[start:start + self.datacodeG2])
+            start += self.datacodeG2
+
+    def generator_poly(self):
+        # Returns a copy of the cached generator poly for the number of error correction codewords
+        # The polynomial is in the alpha notation form
+        return generator_poly(self.n_eccodewords).copy()
+
+    def message_poly(self):
+        # Creates the message polynomial which is represented by an array of [a, b, c,...]
+        # This represents the polynomial a + bx + cx^2 + ....
+        message = []
+        for block in self.g1 + self.g2:
+            message.extend(block)
+
+        message.reverse()
+        return message
+
+    def get_eccodewords(self):
+        # Returns the error correction codewords of each block, as bytes
+        self.ec_codewords = [rs_encode(block, self.n_eccodewords) for block in self.g1 + self.g2]
+        return self.ec_codewords
+
+    def get_eccodewords_reference(self):
+        # Returns the error correction codewords as integers
+        # This is the original long division in alpha notation, kept as a reference to cross-check get_eccodewords
+        # It treats all the data codewords as a single block
+        message = self.message_poly()
+        for i in range(len(message)):
+            message[i] = GF_LOG[message[i]] if message[i] else ''
+        generator = self.generator_poly()
+
+        n_messageterm = len(message) # This is the original amount of terms
+        # The firts step is to multiply the message polynomial by x^n where n is the number of error correction
+        # codewords needed. This is to ensure that the exponent does not vanish during the divisions.
+        # In this case, 0 means 2 ** 0 = 1, so I will use '' as a representation of 0
+        for _ in range(self.n_eccodewords):
+            message.insert(0, '')
+
+        # The lead term of the generator polynomial should also have the same exponent
+        for _ in range(len(message) - len(generator)):
+            generator.insert(0, '')
+
+        # The number of divisions must equal the number of terms in the message polynomial
+        # This will result in a remainder of len(message) - n_messageterm which will be the codewords
+        # For example, this should be 7 for a 1-L code
+        ## STEPS ##
+        # Multiply the Generator Polynomial by the Lead Term of the Message Polynomial
+        # XOR the result with the message polynomial
+        # REPEAT: Multiply the Generator Polynomial by the Lead Term of the XOR result from the previous step
+        aux = []
+        term = message[len(message) - 1]
+        for i in range(n_messageterm):
+
+            for j in range(len(generator)):
+
+                # Since we are using exponents, there is no need to multiply them
+                # If either the generator or the lead term is zero, so is the product
+                if generator[j] != '' and term != '':
+                    value = GF_EXP[(term + generator[j]) % 255]
+                else:
+                    value = 0
+
+                # If message is zero, the XOR result is the value itself
+                if message[j] != '':
+                    value ^= GF_EXP[message[j]]
+
+                aux.append(value)
+            
+            # Now it is important to get the next term to be multiplied
+            # The message should be the result
+            message = aux.copy()
+            message[len(message) - 1 - i] = 0
+
+            # Turning the message back to the alpha notation. Coefficients that vanished become ''
+            for k in range(len(message)):
+                message[k] = GF_LOG[message[k]] if message[k] else ''
+            term = message[-2 - i]
+            
+            # Adjusting the generator to the exponents needed
+            for k in range(len(generator) - 1):
+                generator[k] = generator[k + 1]
+            generator[len(generator) - 1] = ''
+
+            aux.clear()
+
+        # The error correction codewords are the remainder terms, from the highest exponent to the lowest
+        eccodewords = []
+        for k in range(self.n_eccodewords - 1, -1, -1):
+            eccodewords.append(GF_EXP[message[k]] if message[k] != '' else 0)
+
+        self.ec_codewords = eccodewords
+        return eccodewords
+
+
+    def place_eccodewords(self):
+        # Builds the final message in the qr code buffer: the data codewords interleaved block by block, followed by
+        # the ec codewords interleaved the same way and the remainder bits
+        # Blocks of group 2 have one data codeword more than the ones of group 1. Those go after the common ones
+        blocks = self.g1 + self.g2
+        n_blocks = len(blocks)
+        common = n_blocks * self.datacodeG1 # Data codewords taken from every block
+        message = bytearray(len(self.codewords) + n_blocks * self.n_eccodewords)
+
+        for i, block in enumerate(blocks):
+            message[i:common:n_blocks] = block[:self.datacodeG1]
+        for i, block in enumerate(self.g2):
+            message[common + i] = block[self.datacodeG1]
+
+        ec_start = len(self.codewords)
+        for i, ec_block in enumerate(self.ec_codewords):
+            message[ec_start + i::n_blocks] = ec_block
+
+        # The remainder bits fill the data modules that are left after the last codeword
+        remainder = len(placement_order(self.version)[0]) - 8 * len(message)
+        self.buffer = BitBuffer()
+        self.buffer.append_bytes(message)
+        self.buffer.append_bits(0, remainder)
+
+    #endregion
+
+    #region ---- CODE STRUCTURE -----
+   
+    # For now, this is very inefficient and all those steps can be done at once.
+    # To keep things easier to debug, I've implemented them separetely
+
+    def show_code(self):
+        from matplotlib import pyplot as plt
+        # plt.ion()
+        plt.imshow(self.matrix, interpolation='nearest', cmap='gray_r', vmin=0, vmax=1)
+        plt.show()
+        # plt.pause(0.7)
+        # plt.close("all") 
+
+
+    def isCovered(self, row, column):
+        # Tells whether the module belongs to a function pattern or to the format or version information
+        return self.reserved[row * self.shape + column] == 1
+
+
+    def data_placement(self):
+        # Places the bits of the buffer in the data modules, following the order given by placement_order
+        # When the bits run out, the remainder modules are left as zeros
+        rows, cols = placement_order(self.version)
+
+        if masks.BACKEND == 'numpy':
+            np = numpy_module()
+            bits = np.zeros(len(rows), dtype=np.uint8)
+            data = np.unpackbits(np.frombuffer(self.buffer.to_bytes(), dtype=np.uint8))[:len(rows)]
+            bits[:len(data)] = data
+            matrix = np.array(self.matrix, dtype=np.uint8)
+            matrix[np.frombuffer(rows, dtype=np.uint16), np.frombuffer(cols, dtype=np.uint16)] = bits
+            self.matrix = matrix
+            return
+
+        matrix = self.matrix
+        bits = iter(self.buffer)
+        for row, column in zip(rows, cols):
+            matrix[row][column] = next(bits, 0)
+
+
+    def evaluate(self, matrix):
+        # This function evaluates a given matrix and returns its penalty score based on four evaluation conditions
+        # The conditions are described in penalty_score
+        rows, cols = pack_matrix(matrix)
+        return penalty_score(rows, cols, self.shape)
+
+
+    def data_mask(self, with_format=False):
+        # After encoding the data, eight masks must be applied to it and evaluated based on four conditions
+        # The evaluation gives it a penalty score. The lowest penalty score wins.
+        # RETURNS THE MASK NUMBER and SETS THE BEST MATRIX TO SELF.MATRIX
+        # If with_format is True, each mask is evaluated with its format information in place (it is written afterwards
+        # by format_version either way)
+
+        # The mask patterns are listed in MASK_PATTERNS
+        if masks.BACKEND == 'numpy': # data_placement left a NumPy array in self.matrix
+            return self.data_mask_numpy(with_format)
+        if self.mask is not None: # The mask was given, nothing is evaluated
+            self.mask_number = self.mask
+        else:
+            # The matrix is packed into integers a single time. Each mask is then a XOR with the packed modules it
+            # switches and all eight masked matrices are scored from the packed rows and columns
+            rows, cols = pack_matrix(self.matrix)
+            switches = format_switches(self.version, self.ec) if with_format else mask_switches(self.version)
+            penalties = mask_scores(rows, cols, switches, self.shape)
+            self.mask_number = penalties.index(min(penalties))
+
+        # Only the best mask is applied to the matrix
+        pattern = MASK_PATTERNS[self.mask_number]
+        reserved = self.reserved
+        for row in range(self.shape):
+            line = self.matrix[row]
+            offset = row * self.shape
+            for column in range(self.shape):
+                if not reserved[offset + column] and pattern(row, column): # The reserved areas should not be masked
+                    line[column] = 1 - line[column]
+
+        return self.mask_number
+
+
+    def function_mask_array(self):
+        # Returns a NumPy boolean array that is True on the reserved areas
+        return numpy_module().frombuffer(self.reserved, dtype=bool).reshape(self.shape, self.shape)
+
+
+    def data_mask_numpy(self, with_format=False):
+        # Same as data_mask, but the eight masks are applied and evaluated at once with NumPy arrays
+        np = numpy_module()
+        matrix = np.asarray(self.matrix, dtype=np.uint8)
+        switch = mask_arrays(self.shape) & ~self.function_mask_array()
+        if self.mask is not None: # The mask was given, only that one is applied
+            self.mask_number = self.mask
+            self.matrix = [bytearray(row.tobytes()) for row in matrix ^ switch[self.mask]]
+            return self.mask_number
+
+        if with_format:
+            switch = switch | format_arrays(self.version, self.ec)
+        matrices = matrix ^ switch
+
+        penalties = penalties_numpy(matrices)
+        self.mask_number = int(np.argmin(penalties))
+        self.matrix = [bytearray(row.tobytes()) for row in matrices[self.mask_number]]
+        return self.mask_number
+
+
+    def format_string(self):
+        # Returns the 15 format bits as a string, see FORMAT_INFO
+        return format(FORMAT_INFO[(self.ec, self.mask_number)], '015b')
+
+
+    def format_version(self):
+        # Writes both copies of the format information, bit 14 (the most significant) first
+        bits = FORMAT_INFO[(self.ec, self.mask_number)]
+        for i, ((row1, column1), (row2, column2)) in enumerate(format_positions(self.version)):
+            bit = (bits >> (14 - i)) & 1
+            self.matrix[row1][column1] = bit
+            self.matrix[row2][column2] = bit
+
+
+    def build(self):
+        # Runs every step, from the raw data encoding to the quiet zone, and returns the final matrix
+        self.encode_data()
+        self.terminator()
+        self.padding()
+        self.data_codewords()
+        self.get_eccodewords()
+        self.place_eccodewords()
+        self.data_placement()
+        self.data_mask()
+        self.format_version()
+        return self.quiet_zone()
+
+
+    def symbol(self):
+        # Returns the matrix, without the quiet zone, as a bit-packed Symbol sharing the function mask of the version
+        matrix = self.matrix
+        if len(matrix) != self.shape: # The quiet zone was already added
+            matrix = [row[4:-4] for row in matrix[4:-4]]
+        return Symbol.from_matrix(matrix, function_mask(self.version))
+
+
+    def quiet_zone(self):
+        # Adds a required 4-module-wide area of white modules to the matrix
+        final_matrix = []
+        white_row = []
+        for _ in range(self.shape + 8):
+            white_row.append(WHITE)
+
+        # 4 rows top padding
+        for _ in range(4):
+            final_matrix.append(white_row)
+
+        # Left and right padding
+        for i in range(self.shape):
+            row = []
+            for j in range(self.shape + 8):
+                if j < 4 or j >= self.shape + 4:
+                    row.append(WHITE)
+                else:
+                    row.append(self.matrix[i][j - 4])
+            
+            final_matrix.append(row)
+
+        # 4 rows bottom padding
+        for _ in range(4):
+            final_matrix.append(white_row)
+
+        self.matrix = final_matrix
+        return final_matrix
+    
+    #endregion
+
+
+# Conversion method used for each mode
+CONVERSIONS = {
+    'Numeric': QRCode.numeric_conversion,
+    'Alphanumeric': QRCode.alpha_conversion,
+    'Byte': QRCode.byte_conversion,
+    'Kanji': QRCode.kanji_conversion
+}
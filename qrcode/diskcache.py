@@ -0,0 +1,142 @@
+import hashlib
+import mmap
+import os
+import struct
+
+try:
+    import fcntl
+except ImportError: # Not available on Windows, where the appends of several processes are not serialized
+    fcntl = None
+
+from .bits import Symbol
+from .core import QRCode
+from .patterns import function_mask
+from .tables import VERSIONS_DIMENSIONS
+
+
+#region ---- DISK CACHE ----
+# Cache of finished codes shared by every process on a host and kept between restarts
+# Every version has an append-only file (v01.bin, v02.bin, ...) of packed symbols with a fixed stride, in the layout of
+# Symbol, so the symbol in slot n starts at byte n * stride * size. The index (index.bin) is an append-only list of
+# records: the 16-byte hash of the key, the version and the slot
+# Symbols are read through mmap, and a new symbol is written to its version file before its index record, so an
+# index record never points to a symbol that is not there yet
+
+INDEX_RECORD = struct.Struct('>16sBI')
+
+def cache_key(data, mode=None, version=None, ec_level='L', mask=None):
+    # Returns the 16-byte hash of the key used by SymbolCache
+    return hashlib.blake2b(repr((data, mode, version, ec_level, mask)).encode(), digest_size=16).digest()
+
+
+class DiskCache():
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.index = {} # Hash of the key -> (version, slot)
+        self.index_file = open(os.path.join(directory, 'index.bin'), 'a+b')
+        self.index_offset = 0 # Bytes of the index file already read
+        self.files = {} # Version files opened for appending, indexed by version
+        self.maps = {} # Read-only maps of the version files, indexed by version
+        self.hits = 0
+        self.misses = 0
+        self.refresh()
+
+    def refresh(self):
+        ## Reads the index records added since the last call, by this process or any other one
+        self.index_file.seek(self.index_offset)
+        data = self.index_file.read()
+        usable = len(data) - len(data) % INDEX_RECORD.size # A record being written by another process is left for later
+        for digest, version, slot in INDEX_RECORD.iter_unpack(data[:usable]):
+            self.index[digest] = (version, slot)
+        self.index_offset += usable
+
+    def record_size(self, version):
+        size = VERSIONS_DIMENSIONS[version]
+        return (size + 7) // 8 * size
+
+    def view(self, version, slot):
+        ## Returns a memoryview of the packed symbol in the mapped version file, without copying it
+        record = self.record_size(version)
+        end = (slot + 1) * record
+        mapped = self.maps.get(version)
+        if mapped is None or len(mapped) < end:
+            # The file grew since it was mapped. The old map is left to the garbage collector, since views of it
+            # may still be in use
+            with open(os.path.join(self.directory, f'v{version:02d}.bin'), 'rb') as file:
+                mapped = self.maps[version] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[end - record:end]
+
+    def append(self, digest, version, packed):
+        ## Appends a packed symbol to its version file and then its record to the index. Returns its (version, slot)
+        ## If another process stored the same key after the index was last read, nothing is written
+        file = self.files.get(version)
+        if file is None:
+            file = self.files[version] = open(os.path.join(self.directory, f'v{version:02d}.bin'), 'ab')
+
+        if fcntl is not None:
+            fcntl.flock(self.index_file, fcntl.LOCK_EX) # Every writer takes the lock of the index
+        try:
+            self.refresh() # Under the lock, the index is complete
+            found = self.index.get(digest)
+            if found is not None:
+                return found
+
+            end = os.fstat(file.fileno()).st_size
+            if end % len(packed): # A write was cut short, the rest of its slot is filled so the stride is kept
+                file.write(bytes(len(packed) - end % len(packed)))
+            file.write(packed)
+            file.flush()
+            slot = file.tell() // len(packed) - 1
+            self.index_file.seek(0, os.SEEK_END)
+            self.index_file.write(INDEX_RECORD.pack(digest, version, slot))
+            self.index_file.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self.index_file, fcntl.LOCK_UN)
+        self.index[digest] = (version, slot)
+        return version, slot
+
+    def packed(self, data, mode=None, version=None, ec_level='L', mask=None):
+        # Returns the size of the code and a read-only memoryview of its packed modules (see Symbol), without the
+        # quiet zone. On a miss the code is built and added to the cache
+        digest = cache_key(data, mode, version, ec_level, mask)
+        found = self.index.get(digest)
+        if found is None:
+            self.refresh() # It may have been added by another process
+            found = self.index.get(digest)
+
+        if found is not None:
+            self.hits += 1
+            code_version, slot = found
+            return VERSIONS_DIMENSIONS[code_version], self.view(code_version, slot)
+
+        self.misses += 1
+        code = QRCode(data, mode, version, ec_level, mask)
+        code.build()
+        symbol = code.symbol()
+        self.append(digest, code.version, symbol.data)
+        return symbol.size, memoryview(symbol.data).toreadonly()
+
+    def symbol(self, data, mode=None, version=None, ec_level='L', mask=None):
+        # Same as packed, but returns a Symbol, which has its own copy of the modules
+        size, packed = self.packed(data, mode, version, ec_level, mask)
+        return Symbol(size, packed, function_mask((size - 17) // 4))
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'symbols': len(self.index)}
+
+    def close(self):
+        self.index_file.close()
+        for file in self.files.values():
+            file.close()
+        self.files.clear()
+        self.maps.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#endregion
@@ -0,0 +1,143 @@
+from .tables import EC_BLOCKS
+
+
+# Galois Field GF(256) with byte-wise modulo 285
+# GF_EXP[i] holds 2^i and GF_LOG[x] holds the exponent i such that 2^i = x (GF_LOG[0] is never used)
+# GF_EXP has 512 entries so that the sum of two logarithms can be looked up without a modulo
+GF_EXP = [0] * 512
+GF_LOG = [0] * 256
+
+def build_gf_tables():
+    ## Fills the exponent and logarithm tables. This runs only once, when the module is imported
+    value = 1
+    for i in range(255):
+        GF_EXP[i] = value
+        GF_LOG[value] = i
+        value <<= 1
+        if value >= 256:
+            value ^= 285
+
+    for i in range(255, 512):
+        GF_EXP[i] = GF_EXP[i - 255]
+
+build_gf_tables()
+
+
+def gf_mul(a, b):
+    # Multiplies two elements of GF(256) in integer notation
+    if a == 0 or b == 0:
+        return 0
+    return GF_EXP[GF_LOG[a] + GF_LOG[b]]
+
+
+def gf_div(a, b):
+    # Divides two elements of GF(256) in integer notation
+    if b == 0:
+        raise ZeroDivisionError('division by zero in GF(256)')
+    if a == 0:
+        return 0
+    return GF_EXP[GF_LOG[a] + 255 - GF_LOG[b]]
+
+
+def gf_mul_vec(values, scalar):
+    # Multiplies every element of ´values´ by ´scalar´, all of them in integer notation
+    if scalar == 0:
+        return [0] * len(values)
+    log_s = GF_LOG[scalar]
+    return [GF_EXP[GF_LOG[v] + log_s] if v else 0 for v in values]
+
+
+def gf_div_vec(values, scalar):
+    # Divides every element of ´values´ by ´scalar´, all of them in integer notation
+    if scalar == 0:
+        raise ZeroDivisionError('division by zero in GF(256)')
+    log_s = 255 - GF_LOG[scalar]
+    return [GF_EXP[GF_LOG[v] + log_s] if v else 0 for v in values]
+
+
+def poly_mult(p1, p2):
+    # A polynomial is represented by an array [a, bx^0, cx^1, ...]
+    # In order forl this to work, we must use exponents of 2, so the polynomial must have a, b, c only as the value of the exponent
+    # If the polynomial is 1 + 2x + 4x^2, the array should be [0, 1, 2]
+    # This routine makes use of the arrays to calculate the multiplication
+    # The output is in the form [a, b, c, ...] meaning 2^a + 2^b x + 2^c x^2 + ...
+
+    # Initializing the new polynomial with neutral XOR operator
+    new_p = [0] * (len(p1) + len(p2) - 1)
+
+    # First getting the polynomial in its conventional form
+    for i in range(len(p1)):
+        for j in range(len(p2)):
+            # Since we are using exponents, there is no need to multiply them
+            new_p[i + j] ^= GF_EXP[(p1[i] + p2[j]) % 255]
+
+    # Converting back to the generator polynomial
+    for i in range(len(new_p)):
+        new_p[i] = GF_LOG[new_p[i]]
+
+    return new_p
+
+
+# Generator polynomials in alpha notation, indexed by the number of error correction codewords
+# There are only a few distinct counts, so every polynomial is built once and shared by all QR Codes
+GENERATOR_POLYS = {1: [0, 0]}
+
+def generator_poly(n_code):
+    # Returns the generator polynomial (x - 2^0)(x - 2^1)...(x - 2^(n_code - 1)) in alpha notation
+    # The polynomial is built from the largest one already cached. The returned list must not be modified
+    poly = GENERATOR_POLYS.get(n_code)
+    if poly is not None:
+        return poly
+
+    start = max(n for n in GENERATOR_POLYS if n < n_code)
+    poly = GENERATOR_POLYS[start]
+    for i in range(start, n_code):
+        poly = poly_mult(poly, [i, 0])
+        GENERATOR_POLYS[i + 1] = poly
+
+    return poly
+
+
+def precompute_generators():
+    # Fills the cache with the generator polynomial of every EC codeword count used by the tables
+    for n_code in sorted(set(entry[0] for row in EC_BLOCKS[1:] for entry in row)):
+        generator_poly(n_code)
+
+
+# Feedback tables of the Reed-Solomon shift register, indexed by the number of error correction codewords
+# Entry f of a table is the product of the generator polynomial (without its leading term) by f, packed into an
+# integer with one byte per coefficient, highest exponent first
+RS_FEEDBACK = {}
+
+def rs_feedback_table(n_code):
+    # Returns the 256 feedback values of the shift register for ´n_code´ error correction codewords
+    table = RS_FEEDBACK.get(n_code)
+    if table is not None:
+        return table
+
+    # Converting the generator to integer notation, highest exponent first and without the leading 1
+    generator = [GF_EXP[c] for c in reversed(generator_poly(n_code)[:-1])]
+    table = [0] * 256
+    for factor in range(1, 256):
+        value = 0
+        for coefficient in gf_mul_vec(generator, factor):
+            value = (value << 8) | coefficient
+        table[factor] = value
+
+    RS_FEEDBACK[n_code] = table
+    return table
+
+
+def rs_encode(message, n_code):
+    # Returns the ´n_code´ error correction codewords of ´message´ (bytes, bytearray or memoryview) as bytes
+    # The remainder of the polynomial division is kept in a shift register stored as a single integer
+    # For each data codeword, the register is shifted one byte and XORed with the feedback of its leading byte
+    table = rs_feedback_table(n_code)
+    shift = 8 * (n_code - 1)
+    mask = (1 << (8 * n_code)) - 1
+    register = 0
+    for codeword in message:
+        register = ((register << 8) & mask) ^ table[(register >> shift) ^ codeword]
+
+    return register.to_bytes(n_code, 'big')
+
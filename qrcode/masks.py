@@ -0,0 +1,250 @@
+from importlib.util import find_spec
+
+from .patterns import format_positions, reserved_modules
+from .tables import BLACK, FORMAT_INFO, VERSIONS_DIMENSIONS, WHITE
+
+
+#region ---- DATA MASKS ----
+# Mask Number / If the formula below is true for a given row/column coordinate, switch the bit at that coordinate
+# This table is available at https://www.thonky.com/qr-code-tutorial/mask-patterns
+MASK_PATTERNS = (
+    lambda row, column: (row + column) % 2 == 0,
+    lambda row, column: row % 2 == 0,
+    lambda row, column: column % 3 == 0,
+    lambda row, column: (row + column) % 3 == 0,
+    lambda row, column: (row // 2 + column // 3) % 2 == 0,
+    lambda row, column: ((row * column) % 2) + ((row * column) % 3) == 0,
+    lambda row, column: (((row * column) % 2) + ((row * column) % 3)) % 2 == 0,
+    lambda row, column: (((row + column) % 2) + ((row * column) % 3)) % 2 == 0
+)
+
+# Backend used to apply and evaluate the masks: 'numpy' when NumPy is installed, 'python' otherwise
+# NumPy is optional and only imported the first time the NumPy backend is used (see numpy_module), so importing the
+# package stays fast and a process that sets BACKEND = 'python' never loads it
+BACKEND = 'numpy' if find_spec('numpy') is not None else 'python'
+np = None
+
+def numpy_module():
+    # Returns the numpy module, importing it the first time
+    global np
+    if np is None:
+        import numpy as np
+    return np
+
+# Boolean arrays of shape (8, size, size) with the modules switched by each mask, indexed by the size of the matrix
+MASK_ARRAYS = {}
+
+# Windows of 11 modules that look like a finder pattern (dark = 1), read as binary numbers
+FINDER_LIKE = (0b10111010000, 0b00001011101)
+
+def pack_matrix(matrix):
+    # Packs the dark modules of the matrix into integers, one for each row and one for each column
+    # The first module of a row (or column) is the most significant bit. Everything but BLACK counts as light
+    # Rows and columns are filled in the same pass through the matrix
+    size = len(matrix)
+    rows = [0] * size
+    cols = [0] * size
+    for i in range(size):
+        row = 0
+        row_bit = 1 << (size - 1 - i)
+        line = matrix[i]
+        for j in range(size):
+            row <<= 1
+            if line[j] == BLACK:
+                row |= 1
+                cols[j] |= row_bit
+        rows[i] = row
+
+    return rows, cols
+
+
+MASK_SWITCHES = {} # Packed switches of the eight masks, indexed by version
+
+def mask_switches(version):
+    # Returns, for each mask, the packed rows and columns of the modules it switches
+    # The reserved modules are never masked
+    switches = MASK_SWITCHES.get(version)
+    if switches is not None:
+        return switches
+
+    size = VERSIONS_DIMENSIONS[version]
+    reserved = reserved_modules(version)
+    switches = []
+    for pattern in MASK_PATTERNS:
+        matrix = [[BLACK if pattern(row, column) and not reserved[row * size + column] else WHITE
+                   for column in range(size)] for row in range(size)]
+        switches.append(pack_matrix(matrix))
+
+    MASK_SWITCHES[version] = switches
+    return switches
+
+
+FORMAT_SWITCHES = {} # Mask switches with the dark format modules of each mask added, indexed by (version, EC level)
+
+def format_switches(version, ec_level):
+    # Same as mask_switches, but each mask also sets the dark modules of its format information, so the masks can be
+    # evaluated with the format information in place. The format modules are reserved and light in the template, so
+    # XORing them has the same effect as writing them
+    switches = FORMAT_SWITCHES.get((version, ec_level))
+    if switches is not None:
+        return switches
+
+    size = VERSIONS_DIMENSIONS[version]
+    positions = format_positions(version)
+    switches = []
+    for mask_number, (rows, cols) in enumerate(mask_switches(version)):
+        rows = list(rows)
+        cols = list(cols)
+        bits = FORMAT_INFO[(ec_level, mask_number)]
+        for i, modules in enumerate(positions):
+            if (bits >> (14 - i)) & 1:
+                for row, column in modules:
+                    rows[row] |= 1 << (size - 1 - column)
+                    cols[column] |= 1 << (size - 1 - row)
+        switches.append((rows, cols))
+
+    FORMAT_SWITCHES[(version, ec_level)] = switches
+    return switches
+
+
+def penalty_score(rows, cols, size):
+    # Returns the penalty score of a matrix given as packed rows and columns (see pack_matrix)
+    # Every condition is computed for a whole row (or column) at once with bitwise operations on its integer
+    full = (1 << size) - 1
+    pairs = full >> 1 # Positions where a module can be compared with the next one
+    windows = full >> 10 # Positions where a window of 11 modules can start
+    score = 0
+
+    for lines in (rows, cols):
+        for line in lines:
+            # EVALUATION CONDITION 1
+            # Bit k of ´same´ is set when modules k and k + 1 have the same color, so a run of n >= 5 modules
+            # gives n - 4 bits in ´run5´. The penalty of the run is 3 + (n - 5) = (n - 4) + 2
+            same = ~(line ^ (line >> 1)) & pairs
+            run5 = same & (same >> 1) & (same >> 2) & (same >> 3)
+            if run5:
+                score += run5.bit_count() + 2 * (run5 & ~(run5 << 1)).bit_count()
+
+            # EVALUATION CONDITION 3
+            # Looking for 1011101 with four light modules on either side, BWBBBWBWWWW or WWWWBWBBBWB
+            light = ~line & full
+            before = windows # Windows matching 1011101 followed by 0000
+            after = windows # Windows matching 0000 followed by 1011101
+            for k in range(11):
+                if (FINDER_LIKE[0] >> k) & 1:
+                    before &= line >> k
+                else:
+                    before &= light >> k
+                if (FINDER_LIKE[1] >> k) & 1:
+                    after &= line >> k
+                else:
+                    after &= light >> k
+            score += 40 * (before.bit_count() + after.bit_count())
+
+    # EVALUATION CONDITION 2
+    # A 2x2 block has the same color when both pairs of vertically adjacent modules match and so do the top two
+    for i in range(size - 1):
+        top = rows[i]
+        vertical = ~(top ^ rows[i + 1]) & full
+        blocks = vertical & (vertical >> 1) & ~(top ^ (top >> 1)) & pairs
+        score += 3 * blocks.bit_count()
+
+    # EVALUATION CONDITION 4
+    # Adding 10 for every 5% that the proportion of dark modules is away from 50%
+    total = size * size
+    dark = sum(row.bit_count() for row in rows)
+    score += 10 * (abs(20 * dark - 10 * total) // total)
+
+    return score
+
+
+def mask_scores(rows, cols, switches, size):
+    # Returns the penalty score of each mask applied to the packed matrix
+    # A masked matrix is just the XOR of the packed rows and columns with the switches of the mask
+    scores = []
+    for switch_rows, switch_cols in switches:
+        masked_rows = [row ^ switch for row, switch in zip(rows, switch_rows)]
+        masked_cols = [col ^ switch for col, switch in zip(cols, switch_cols)]
+        scores.append(penalty_score(masked_rows, masked_cols, size))
+    return scores
+
+
+def mask_arrays(size):
+    # Returns the eight mask patterns for a matrix of the given size as a NumPy boolean array
+    masks = MASK_ARRAYS.get(size)
+    if masks is None:
+        np = numpy_module()
+        row, column = np.indices((size, size))
+        masks = np.stack([pattern(row, column) for pattern in MASK_PATTERNS])
+        masks.flags.writeable = False
+        MASK_ARRAYS[size] = masks
+
+    return masks
+
+
+FORMAT_ARRAYS = {}
+
+def format_arrays(version, ec_level):
+    # Returns the dark format modules of each of the eight masks as a NumPy boolean array, see format_switches
+    arrays = FORMAT_ARRAYS.get((version, ec_level))
+    if arrays is None:
+        np = numpy_module()
+        size = VERSIONS_DIMENSIONS[version]
+        arrays = np.zeros((8, size, size), dtype=bool)
+        for mask_number in range(8):
+            bits = FORMAT_INFO[(ec_level, mask_number)]
+            for i, modules in enumerate(format_positions(version)):
+                if (bits >> (14 - i)) & 1:
+                    for row, column in modules:
+                        arrays[mask_number, row, column] = True
+        arrays.flags.writeable = False
+        FORMAT_ARRAYS[(version, ec_level)] = arrays
+
+    return arrays
+
+
+def penalties_numpy(matrices):
+    # Returns the penalty scores of a stack of matrices with shape (k, size, size), one score per matrix
+    # Everything but BLACK counts as light, as in penalty_score
+    np = numpy_module()
+    count, size, _ = matrices.shape
+    dark = matrices == BLACK
+    scores = np.zeros(count, dtype=np.int64)
+
+    for bits in (dark, dark.transpose(0, 2, 1)):
+        # EVALUATION CONDITION 1: runs of five or more modules of the same color in a row (or column)
+        # Each row is padded with a value that never matches, so every run starts and ends at a change of value
+        padded = np.full((count, size, size + 2), -1, dtype=np.int8)
+        padded[:, :, 1:-1] = bits
+        k, r, c = np.nonzero(padded[:, :, 1:] != padded[:, :, :-1])
+        same_row = (k[1:] == k[:-1]) & (r[1:] == r[:-1])
+        lengths = (c[1:] - c[:-1])[same_row]
+        owners = k[1:][same_row]
+        long_runs = lengths >= 5
+        scores += np.bincount(owners[long_runs], weights=lengths[long_runs] - 2, minlength=count).astype(np.int64)
+
+        # EVALUATION CONDITION 3: windows of 11 modules looking like a finder pattern
+        # As in penalty_score, every module of the window is matched with a slice of the matrix shifted by its position
+        light = ~bits
+        before = after = None # Windows matching 10111010000 and 00001011101
+        for k in range(11):
+            shift = 10 - k # Bit of the module in FINDER_LIKE
+            modules = slice(k, size - 10 + k)
+            before_modules = (bits if (FINDER_LIKE[0] >> shift) & 1 else light)[:, :, modules]
+            after_modules = (bits if (FINDER_LIKE[1] >> shift) & 1 else light)[:, :, modules]
+            before = before_modules.copy() if before is None else before & before_modules
+            after = after_modules.copy() if after is None else after & after_modules
+        scores += 40 * (before.sum(axis=(1, 2)) + after.sum(axis=(1, 2)))
+
+    # EVALUATION CONDITION 2: 2x2 blocks of the same color, overlapping blocks included
+    corner = dark[:, :-1, :-1]
+    blocks = (corner == dark[:, 1:, :-1]) & (corner == dark[:, :-1, 1:]) & (corner == dark[:, 1:, 1:])
+    scores += 3 * blocks.sum(axis=(1, 2))
+
+    # EVALUATION CONDITION 4: proportion of dark modules, 10 points for each 5% away from 50%
+    total = size * size
+    scores += 10 * (np.abs(20 * dark.sum(axis=(1, 2)) - 10 * total) // total)
+
+    return scores
+
+#endregion
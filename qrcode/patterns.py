@@ -0,0 +1,179 @@
+from array import array
+
+from .bits import matrix_to_bytes
+from .tables import ALIGNMENT_POSITIONS, BLACK, VERSION_INFO, VERSIONS_DIMENSIONS
+
+
+#region ---- FUNCTION PATTERNS ----
+# The modules used by the finder, separator, timing and alignment patterns, the format and version information and
+# the dark module are the same for every QR Code of a version. They are marked once in a bitmap of size * size bytes,
+# where the module at (row, column) is reserved if reserved[row * size + column] is 1
+
+RESERVED_MODULES = {} # Bitmaps indexed by version
+
+def reserved_modules(version):
+    # Returns the bitmap of reserved modules of the given version. The returned bytearray must not be modified
+    reserved = RESERVED_MODULES.get(version)
+    if reserved is not None:
+        return reserved
+
+    size = VERSIONS_DIMENSIONS[version]
+    reserved = bytearray(size * size)
+
+    def reserve(row, column, height, width):
+        for i in range(row, row + height):
+            reserved[i * size + column:i * size + column + width] = b'\x01' * width
+
+    # Finder patterns, separators and format information
+    reserve(0, 0, 9, 9) # Top left
+    reserve(0, size - 8, 9, 8) # Top right
+    reserve(size - 8, 0, 8, 9) # Bottom left (the dark module is included here)
+
+    # Timing patterns
+    reserve(6, 0, 1, size)
+    reserve(0, 6, size, 1)
+
+    # Alignment patterns
+    positions = ALIGNMENT_POSITIONS[version]
+    for row in positions:
+        for column in positions:
+            if (row, column) in ((6, 6), (6, positions[-1]), (positions[-1], 6)): # Overlapping a finder pattern
+                continue
+            reserve(row - 2, column - 2, 5, 5)
+
+    # Version information
+    if version >= 7:
+        reserve(0, size - 11, 6, 3) # Top right
+        reserve(size - 11, 0, 3, 6) # Bottom left
+
+    RESERVED_MODULES[version] = reserved
+    return reserved
+
+
+FUNCTION_MASKS = {} # Reserved modules packed 8 per byte like a Symbol, indexed by version
+
+def function_mask(version):
+    # Returns the reserved modules of the given version packed in the layout of matrix_to_bytes
+    mask = FUNCTION_MASKS.get(version)
+    if mask is None:
+        size = VERSIONS_DIMENSIONS[version]
+        reserved = reserved_modules(version)
+        mask = FUNCTION_MASKS[version] = matrix_to_bytes([reserved[i:i + size] for i in range(0, size * size, size)])
+    return mask
+
+
+TEMPLATES = {} # Matrices with the function patterns already drawn, indexed by version
+
+def template_matrix(version):
+    # Returns the matrix of the given version with its function patterns drawn, as a bytearray of size * size modules
+    # Data, format and version information modules are left white. The returned bytearray must not be modified
+    template = TEMPLATES.get(version)
+    if template is not None:
+        return template
+
+    size = VERSIONS_DIMENSIONS[version]
+    template = bytearray(size * size) # Everything starts WHITE, separators included
+
+    # FINDER PATTERNS
+    # A 7x7 dark square with a 5x5 white square inside of it and a 3x3 dark square in the center
+    for row, column in ((0, 0), (0, size - 7), (size - 7, 0)):
+        for i in range(7):
+            for j in range(7):
+                if i in (0, 6) or j in (0, 6) or (2 <= i <= 4 and 2 <= j <= 4):
+                    template[(row + i) * size + column + j] = BLACK
+
+    # TIMING PATTERNS
+    for k in range(8, size - 8, 2):
+        template[6 * size + k] = BLACK
+        template[k * size + 6] = BLACK
+
+    # ALIGNMENT PATTERNS
+    # A 5x5 dark square with a 3x3 white square inside of it and a dark module in the center
+    positions = ALIGNMENT_POSITIONS[version]
+    for row in positions:
+        for column in positions:
+            if (row, column) in ((6, 6), (6, positions[-1]), (positions[-1], 6)): # Overlapping a finder pattern
+                continue
+            for i in range(-2, 3):
+                for j in range(-2, 3):
+                    if max(abs(i), abs(j)) != 1:
+                        template[(row + i) * size + column + j] = BLACK
+
+    # VERSION INFORMATION
+    # Two 6x3 blocks with the same 18 bits, the least significant bit closest to the corner of the finder pattern
+    if version >= 7:
+        info = VERSION_INFO[version]
+        for i in range(18):
+            bit = (info >> i) & 1
+            template[(size - 11 + i % 3) * size + i // 3] = bit # Bottom left
+            template[(i // 3) * size + size - 11 + i % 3] = bit # Top right
+
+    # DARK MODULE
+    template[(4 * version + 9) * size + 8] = BLACK # This goes into the same region as the version information
+
+    TEMPLATES[version] = template
+    return template
+
+
+PLACEMENT_ORDER = {} # Coordinates of the data modules in placement order, indexed by version
+
+def placement_order(version):
+    # Returns two arrays with the rows and the columns of the data modules, in the order the bits are placed
+    # The bits go up and down in columns of two modules, starting at the bottom right corner and skipping the
+    # reserved modules. The vertical timing pattern makes the column pairs to its left shift by one
+    order = PLACEMENT_ORDER.get(version)
+    if order is not None:
+        return order
+
+    size = VERSIONS_DIMENSIONS[version]
+    reserved = reserved_modules(version)
+    rows = array('H')
+    cols = array('H')
+
+    going_up = True
+    column = size - 1
+    while column >= 1:
+        if column == 6: # Timing pattern for columns skips only one column
+            column -= 1
+
+        for row in (range(size - 1, -1, -1) if going_up else range(size)):
+            for current in (column, column - 1):
+                if not reserved[row * size + current]:
+                    rows.append(row)
+                    cols.append(current)
+
+        going_up = not going_up
+        column -= 2 # Generally, skipping two columns
+
+    order = (rows, cols)
+    PLACEMENT_ORDER[version] = order
+    return order
+
+
+FORMAT_POSITIONS = {} # Coordinates of the format information modules, indexed by version
+
+def format_positions(version):
+    # Returns the two modules of each format bit, from the most significant bit to the least significant one
+    # The first copy goes around the top left finder pattern, skipping the timing patterns, and the second one is split
+    # between the bottom left (bits 0 to 6) and the top right (bits 7 to 14) finder patterns
+    positions = FORMAT_POSITIONS.get(version)
+    if positions is not None:
+        return positions
+
+    size = VERSIONS_DIMENSIONS[version]
+    first = [(8, column) for column in (0, 1, 2, 3, 4, 5, 7, 8)] + [(row, 8) for row in (7, 5, 4, 3, 2, 1, 0)]
+    second = [(size - 1 - i, 8) for i in range(7)] + [(8, size - 8 + i) for i in range(8)]
+    positions = tuple(zip(first, second))
+    FORMAT_POSITIONS[version] = positions
+    return positions
+
+#endregion
+
+
+# I've come up with three ways to avoid the occupied areas when adding the data to the QR Code
+# - The first one is to keep an array with the covered areas (start, height, width), but that would make it necessary
+#   to go thorough the array for every module of the QR Code, which would not be very fast.
+# - The second option would be to create have a position and and occuppied boolean for every module of the QR Code
+#   This would make it easier to make verifications, but would take up a lot of memory.
+# Since the covered areas only depend on the version, the second option ended up being the better one: a single
+# byte per module is computed once for each version and shared by every QR Code (see reserved_modules).
@@ -0,0 +1,192 @@
+from bisect import bisect_left
+
+from .tables import (ALPHANUMERIC_TABLE, CAPACITY_BITS, CHARACTER_COUNT_BITS, EC_INDEX, VERSION_CLASSES,
+                     encoded_bits, version_class)
+
+
+def segments_bits(segments, vclass):
+    # Returns the total number of bits of the segments for the given version class
+    # or None if the length of a segment does not fit in its character count indicator
+    bits = 0
+    for mode, data in segments:
+        count_bits = CHARACTER_COUNT_BITS[mode][vclass]
+        if len(data) >> count_bits:
+            return None
+        bits += 4 + count_bits + encoded_bits(mode, len(data))
+
+    return bits
+
+
+def select_version(mode, length, ec_level):
+    # Returns the smallest version that fits ´length´ characters in the given mode and error correction level
+    capacity = CAPACITY_BITS[EC_INDEX[ec_level]]
+
+    for vclass, (first, end) in enumerate(VERSION_CLASSES):
+        count_bits = CHARACTER_COUNT_BITS[mode][vclass]
+        if length >> count_bits: # The character count does not fit in its indicator
+            continue
+
+        bits = 4 + count_bits + encoded_bits(mode, length)
+        version = bisect_left(capacity, bits, first, end)
+        if version < end:
+            return version
+
+    raise ValueError(f'{length} characters do not fit in a {mode} QR Code with error correction level {ec_level}')
+
+
+def select_segments(data, ec_level, version=None):
+    # Splits the data into the segments with the fewest bits and returns them with the smallest version that fits
+    # If a version is given, only the segmentation for that version is computed
+    capacity = CAPACITY_BITS[EC_INDEX[ec_level]]
+    costs = character_costs(data) if isinstance(data, str) else None # Shared by the three version classes
+
+    for vclass, (first, end) in enumerate(VERSION_CLASSES):
+        if version is not None and version_class(version) != vclass:
+            continue
+
+        segments = segment_data(data, vclass, costs)
+        bits = segments_bits(segments, vclass)
+        if bits is None:
+            continue
+
+        if version is not None:
+            if bits <= capacity[version]:
+                return version, segments
+            break
+
+        fit = bisect_left(capacity, bits, first, end)
+        if fit < end:
+            return fit, segments
+
+    if version is not None:
+        raise ValueError(f'the data does not fit in a version {version} QR Code with error correction level {ec_level}')
+    raise ValueError(f'the data does not fit in a QR Code with error correction level {ec_level}')
+
+
+#region ---- DATA SEGMENTATION ----
+# Mixed data is split into segments of different modes. The split with the fewest bits is found by dynamic programming
+# over the characters, keeping the cheapest encoding that ends in each mode. Costs are measured in sixths of a bit
+# because a numeric character takes 10/3 bits and an alphanumeric character takes 11/2 bits
+
+SEGMENT_MODES = ('Numeric', 'Alphanumeric', 'Byte', 'Kanji')
+
+def kanji_value(character):
+    # Returns the 13-bit Kanji mode value of the character, or None if it can not be encoded in the Kanji mode
+    try:
+        encoded = character.encode('shift_jis')
+    except UnicodeEncodeError:
+        return None
+
+    if len(encoded) != 2:
+        return None
+
+    code = (encoded[0] << 8) | encoded[1]
+    if 0x8140 <= code <= 0x9FFC:
+        code -= 0x8140
+    elif 0xE040 <= code <= 0xEBBF:
+        code -= 0xC140
+    else:
+        return None
+
+    return (code >> 8) * 0xC0 + (code & 0xFF)
+
+
+def character_costs(data):
+    # Returns the cost of every character in each mode, in sixths of a bit, or None where the mode can not encode it
+    # The costs do not depend on the version, and each distinct character is only looked up once
+    known = {}
+    costs = []
+    for character in data:
+        cost = known.get(character)
+        if cost is None:
+            cost = known[character] = (20 if '0' <= character <= '9' else None,
+                                       33 if character in ALPHANUMERIC_TABLE else None,
+                                       48 * len(character.encode('utf-8')),
+                                       78 if kanji_value(character) is not None else None)
+        costs.append(cost)
+    return costs
+
+
+def segment_data(data, vclass, costs=None):
+    # Returns the list of (mode, data) segments that encodes ´data´ with the fewest bits for the given version class
+    # Byte segments hold the UTF-8 bytes of their characters, the other segments hold strings
+    # Data that is not a string (bytes, for example) is a single Byte segment
+    # costs can be given to reuse the result of character_costs for several version classes
+    if len(data) == 0:
+        return []
+    if not isinstance(data, str):
+        return [('Byte', data)]
+    if costs is None:
+        costs = character_costs(data)
+
+    header_costs = [6 * (4 + CHARACTER_COUNT_BITS[mode][vclass]) for mode in SEGMENT_MODES]
+    infinity = float('inf')
+
+    totals = header_costs.copy()
+    char_modes = [] # For each character, the mode it uses when the prefix ends in each one of the modes
+    for character_cost in costs:
+        new_costs = [infinity] * 4
+        modes = [None] * 4
+
+        best = infinity # Cheapest prefix ending with this character, rounded up to a whole bit
+        for mode in range(4):
+            cost = character_cost[mode]
+            if cost is not None:
+                cost = new_costs[mode] = totals[mode] + cost
+                modes[mode] = mode
+                cost = (cost + 5) // 6 * 6
+                if cost < best:
+                    best = cost
+                    best_mode = mode
+
+        # Starting a new segment after this character. The previous segment is rounded up to a whole bit, and the
+        # cheapest one to switch from is the same for every mode
+        for to_mode in range(4):
+            cost = best + header_costs[to_mode]
+            if cost < new_costs[to_mode]:
+                new_costs[to_mode] = cost
+                modes[to_mode] = best_mode
+
+        totals = new_costs
+        char_modes.append(modes)
+
+    # Going backwards through the characters to recover the mode of each one
+    mode = totals.index(min(totals))
+    segments = []
+    end = len(data)
+    for i in range(len(data) - 1, -1, -1):
+        char_mode = char_modes[i][mode]
+        if char_mode != mode and end != i + 1:
+            segments.append((SEGMENT_MODES[mode], data[i + 1:end]))
+            end = i + 1
+        mode = char_mode
+    segments.append((SEGMENT_MODES[mode], data[:end]))
+    segments.reverse()
+
+    # Every character of a segment suits its mode, so only the Byte segments have to be converted
+    return [(mode, text.encode('utf-8') if mode == 'Byte' else text) for mode, text in segments]
+
+
+def segment_payload(mode, data):
+    # Returns the data stored by a segment of the given mode. The Byte mode stores the UTF-8 bytes of strings
+    # Raises ValueError if the data has a character the mode can not encode
+    if mode not in SEGMENT_MODES:
+        raise ValueError(f'unknown mode {mode!r}, expected one of {", ".join(SEGMENT_MODES)}')
+    if mode == 'Byte':
+        return data.encode('utf-8') if isinstance(data, str) else data
+    if not isinstance(data, str):
+        raise ValueError(f'the {mode} mode encodes text, not {type(data).__name__}')
+
+    if mode == 'Numeric':
+        valid = data.isascii() and (data.isdigit() or data == '') # str.isdigit alone accepts other scripts
+        invalid = None if valid else next(character for character in data if not '0' <= character <= '9')
+    elif mode == 'Alphanumeric':
+        invalid = next((character for character in data if character not in ALPHANUMERIC_TABLE), None)
+    else:
+        invalid = next((character for character in data if kanji_value(character) is None), None)
+    if invalid is not None:
+        raise ValueError(f'{invalid!r} can not be encoded in the {mode} mode')
+
+    return data
+
+#endregion
@@ -0,0 +1,283 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from .batch import warm_tables
+from .core import QRCode
+from .tables import EC_INDEX
+from .writers import WRITERS
+
+
+#region ---- HTTP SERVER ----
+# Small HTTP/1.1 server built on asyncio streams, with a single endpoint:
+#   GET /qr?data=...&ec=M&version=5&mode=Byte&format=png&scale=4&border=4
+#   POST /qr?ec=M&format=svg with the data as the body
+# It answers with the file, GET /stats answers with the counters as JSON
+# The codes are built and rendered in a pool of worker processes (or threads), so the event loop never runs them
+# Requests for a code that is already being built wait for the same result instead of building it again, and if
+# ´max_pending´ different codes are already waiting, new ones are answered with 503 and Retry-After
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pbm': 'image/x-portable-bitmap',
+    'pgm': 'image/x-portable-graymap'
+}
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+MAX_BODY = 16384 # Bytes, more than the 7089 digits of the largest code
+
+def render_code(data, mode, version, ec_level, kind, scale, border):
+    # Builds a code and returns its file. This runs in the worker processes, so it only takes picklable arguments
+    code = QRCode(data, mode, version, ec_level)
+    code.build()
+    return WRITERS[kind](code.symbol(), scale, border)
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=''):
+        super().__init__(message or REASONS[status])
+        self.status = status
+
+
+def parse_options(query, body):
+    # Returns the arguments of render_code from the query string, and the body if there is one
+    # Raises HTTPError(400) if one of them is not valid
+    options = {key: values[-1] for key, values in parse_qs(query, keep_blank_values=True).items()}
+    try:
+        data = body.decode('utf-8') if body else options.get('data')
+    except UnicodeDecodeError:
+        raise HTTPError(400, 'the body must be UTF-8 text')
+    if not data:
+        raise HTTPError(400, 'missing data')
+
+    ec_level = options.get('ec', 'L').upper()
+    kind = options.get('format', 'png').lower()
+    mode = options.get('mode') or None
+    if ec_level not in EC_INDEX:
+        raise HTTPError(400, f'unknown EC level {ec_level!r}')
+    if kind not in CONTENT_TYPES:
+        raise HTTPError(400, f'unknown format {kind!r}')
+    if mode not in (None, 'Numeric', 'Alphanumeric', 'Byte', 'Kanji'):
+        raise HTTPError(400, f'unknown mode {mode!r}')
+
+    try:
+        version = int(options['version']) if options.get('version') else None
+        scale = int(options.get('scale', 4))
+        border = int(options['border']) if options.get('border') else None
+    except ValueError:
+        raise HTTPError(400, 'version, scale and border must be integers')
+    if version is not None and not 1 <= version <= 40:
+        raise HTTPError(400, 'the version must be between 1 and 40')
+    if not 1 <= scale <= 64 or (border is not None and not 0 <= border <= 64):
+        raise HTTPError(400, 'the scale must be between 1 and 64 and the border between 0 and 64')
+
+    return data, mode, version, ec_level, kind, scale, border
+
+
+class QRServer():
+    def __init__(self, host='127.0.0.1', port=8000, workers=None, processes=True, max_pending=256, cache=None):
+        # workers is the size of the pool, processes chooses a process pool (True) or a thread pool (False)
+        # cache is an optional SymbolCache whose rendered files are looked up before going to the pool
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes
+        self.max_pending = max_pending
+        self.cache = cache
+        self.executor = None
+        self.server = None
+        self.inflight = {} # Key of the code -> future of its file
+        self.connections = set() # Tasks answering the open connections
+        self.counters = {'requests': 0, 'built': 0, 'coalesced': 0, 'cached': 0, 'rejected': 0, 'errors': 0}
+
+    async def start(self):
+        # Starts listening. With port 0 a free port is picked and stored in self.port
+        if self.processes:
+            self.executor = ProcessPoolExecutor(self.workers, initializer=warm_tables)
+        else:
+            self.executor = ThreadPoolExecutor(self.workers)
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        # Stops listening, ends the open connections and waits for the pool
+        self.server.close()
+        await self.server.wait_closed()
+        for task in list(self.connections):
+            task.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        self.executor.shutdown(wait=True)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def render(self, options):
+        ## Returns the file of a code, sharing the work with the identical requests in flight
+        key = options
+        data, mode, version, ec_level, kind, scale, border = options
+        if self.cache is not None:
+            rendered = self.cache.get_rendered(data, kind, scale, border, mode, version, ec_level)
+            if rendered is not None:
+                self.counters['cached'] += 1
+                return rendered
+
+        future = self.inflight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+        else:
+            if len(self.inflight) >= self.max_pending:
+                self.counters['rejected'] += 1
+                raise HTTPError(503)
+
+            future = asyncio.get_running_loop().run_in_executor(self.executor, render_code, *options)
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+            self.counters['built'] += 1
+
+        # A client that goes away must not cancel the code for the other requests waiting for it
+        rendered = await asyncio.shield(future)
+        if self.cache is not None:
+            self.cache.put_rendered(rendered, data, kind, scale, border, mode, version, ec_level)
+        return rendered
+
+    async def respond(self, method, target, body):
+        ## Returns the status, the content type and the body of the response
+        url = urlsplit(target)
+        if url.path == '/stats':
+            return 200, 'application/json', json.dumps(dict(self.counters, inflight=len(self.inflight))).encode()
+        if url.path != '/qr':
+            raise HTTPError(404)
+        if method not in ('GET', 'POST'):
+            raise HTTPError(405)
+
+        options = parse_options(url.query, body)
+        try:
+            rendered = await self.render(options)
+        except ValueError as error: # The data does not fit, or has characters its mode can not encode
+            raise HTTPError(400, str(error))
+        return 200, CONTENT_TYPES[options[4]], rendered
+
+    async def handle_connection(self, reader, writer):
+        ## Answers the requests of a connection, one after the other, until the client closes it
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                self.counters['requests'] += 1
+                extra = ''
+                close = False # Set when the end of the request is not known, so the next one can not be read
+                try:
+                    length = headers.get('content-length', '0')
+                    if not (length.isascii() and length.isdigit()):
+                        close = True
+                        raise HTTPError(400, 'invalid Content-Length')
+                    length = int(length)
+                    if length > MAX_BODY:
+                        close = True
+                        raise HTTPError(413)
+                    body = await reader.readexactly(length) if length else b''
+                    status, content_type, payload = await self.respond(method, target, body)
+                except HTTPError as error:
+                    self.counters['errors'] += 1
+                    status, content_type, payload = error.status, 'text/plain; charset=utf-8', str(error).encode()
+                    if status == 503:
+                        extra = 'Retry-After: 1\r\n'
+                except Exception as error: # A bug must not take the connection down without an answer
+                    self.counters['errors'] += 1
+                    close = True
+                    status, content_type = 500, 'text/plain; charset=utf-8'
+                    payload = f'{type(error).__name__}: {error}'.encode()
+
+                keep_alive = not close and version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write((f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                              f'Content-Type: {content_type}\r\n'
+                              f'Content-Length: {len(payload)}\r\n'
+                              f'{extra}'
+                              f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n').encode('latin-1') + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError,
+                asyncio.CancelledError):
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+
+class QRClient():
+    # Minimal HTTP/1.1 client keeping a single connection open, for tests and benchmarks in the same process
+
+    def __init__(self, host='127.0.0.1', port=8000):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, target, body=b''):
+        # Returns the status, the headers and the body of the response
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write((f'{method} {target} HTTP/1.1\r\nHost: {self.host}\r\n'
+                           f'Content-Length: {len(body)}\r\n\r\n').encode('latin-1') + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            await self.close()
+            raise ConnectionError('the server closed the connection without answering')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        payload = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection') == 'close':
+            await self.close()
+        return status, headers, payload
+
+    async def get(self, target):
+        return await self.request('GET', target)
+
+    async def post(self, target, body):
+        return await self.request('POST', target, body)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+            self.reader = self.writer = None
+
+
+def serve(host='127.0.0.1', port=8000, **options):
+    # Runs the server until it is interrupted, see QRServer for the options
+    asyncio.run(QRServer(host, port, **options).serve_forever())
+
+#endregion
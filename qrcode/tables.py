@@ -0,0 +1,200 @@
+WHITE = 0
+BLACK = 1
+
+# Hashmaps
+VERSIONS_DIMENSIONS = {version: 17 + 4 * version for version in range(1, 41)}
+
+def version_info(version):
+    # Returns the 18-bit version information: 6 bits of version followed by the remainder of the BCH(18, 6) code
+    # The remainder is the version multiplied by x^12 and divided by the generator polynomial 1111100100101
+    remainder = version << 12
+    for shift in range(5, -1, -1):
+        if remainder & (1 << (shift + 12)):
+            remainder ^= 0b1111100100101 << shift
+
+    return (version << 12) | remainder
+
+
+# Version information of the versions that have it (7 and up)
+VERSION_INFO = {version: version_info(version) for version in range(7, 41)}
+
+# Rows and columns of the centers of the alignment patterns (ISO/IEC 18004, annex E)
+# The patterns are placed at every combination of these positions that does not overlap a finder pattern
+ALIGNMENT_POSITIONS = {1: (), 2: (6, 18), 3: (6, 22), 4: (6, 26), 5: (6, 30), 6: (6, 34),
+7: (6, 22, 38), 8: (6, 24, 42), 9: (6, 26, 46), 10: (6, 28, 50), 11: (6, 30, 54), 12: (6, 32, 58), 13: (6, 34, 62),
+14: (6, 26, 46, 66), 15: (6, 26, 48, 70), 16: (6, 26, 50, 74), 17: (6, 30, 54, 78), 18: (6, 30, 56, 82), 19: (6, 30, 58, 86), 20: (6, 34, 62, 90),
+21: (6, 28, 50, 72, 94), 22: (6, 26, 50, 74, 98), 23: (6, 30, 54, 78, 102), 24: (6, 28, 54, 80, 106), 25: (6, 32, 58, 84, 110), 26: (6, 30, 58, 86, 114), 27: (6, 34, 62, 90, 118),
+28: (6, 26, 50, 74, 98, 122), 29: (6, 30, 54, 78, 102, 126), 30: (6, 26, 52, 78, 104, 130), 31: (6, 30, 56, 82, 108, 134), 32: (6, 34, 60, 86, 112, 138), 33: (6, 30, 58, 86, 114, 142), 34: (6, 34, 62, 90, 118, 146),
+35: (6, 30, 54, 78, 102, 126, 150), 36: (6, 24, 50, 76, 102, 128, 154), 37: (6, 28, 54, 80, 106, 132, 158), 38: (6, 32, 58, 84, 110, 136, 162), 39: (6, 26, 54, 82, 110, 138, 166), 40: (6, 30, 58, 86, 114, 142, 170)}
+
+ALPHANUMERIC_TABLE = {
+    '0': 0,
+    '1': 1,
+    '2': 2,
+    '3': 3,
+    '4': 4,
+    '5': 5,
+    '6': 6,
+    '7': 7,
+    '8': 8,
+    '9': 9,
+    'A': 10,
+    'B': 11,
+    'C': 12,
+    'D': 13,
+    'E': 14,
+    'F': 15,
+    'G': 16,
+    'H': 17,
+    'I': 18,
+    'J': 19,
+    'K': 20,
+    'L': 21,
+    'M': 22,
+    'N': 23,
+    'O': 24,
+    'P': 25,
+    'Q': 26,
+    'R': 27,
+    'S': 28,
+    'T': 29,
+    'U': 30,
+    'V': 31,
+    'W': 32,
+    'X': 33,
+    'Y': 34,
+    'Z': 35,
+    ' ': 36,
+    '$': 37,
+    '%': 38,
+    '*': 39,
+    '+': 40,
+    '-': 41,
+    '.': 42,
+    '/': 43,
+    ':': 44
+}
+
+MODE_INDICATOR_TABLE = {
+    'Numeric': 0b0001,
+    'Alphanumeric': 0b0010,
+    'Byte': 0b0100,
+    'Kanji': 0b1000
+}
+
+EC_BITS = { # Bits used to create the format string
+    'L': 0b01,
+    'M': 0b00,
+    'Q': 0b11,
+    'H': 0b10
+}
+
+# Index of each error correction level in the tables below
+EC_INDEX = {
+    'L': 0,
+    'M': 1,
+    'Q': 2,
+    'H': 3
+}
+
+def format_info(ec_level, mask_number):
+    # Returns the 15-bit format information: 2 bits of EC level and 3 bits of mask followed by the remainder of the
+    # BCH(15, 5) code with the generator polynomial 10100110111, all of it XORed with 101010000010010
+    data = (EC_BITS[ec_level] << 3) | mask_number
+    remainder = data << 10
+    for shift in range(4, -1, -1):
+        if remainder & (1 << (shift + 10)):
+            remainder ^= 0b10100110111 << shift
+
+    return ((data << 10) | remainder) ^ 0b101010000010010
+
+
+# Format information of the 32 combinations of EC level and mask
+FORMAT_INFO = {(ec_level, mask_number): format_info(ec_level, mask_number) for ec_level in EC_BITS for mask_number in range(8)}
+
+# Error correction blocks for each version (ISO/IEC 18004, table 9), indexed by EC_BLOCKS[version][EC_INDEX[ec_level]]
+# (EC codewords per block, blocks in group 1, data codewords per group 1 block, blocks in group 2, data codewords per group 2 block)
+EC_BLOCKS = (
+    None,
+    ((7, 1, 19, 0, 0), (10, 1, 16, 0, 0), (13, 1, 13, 0, 0), (17, 1, 9, 0, 0)), # 1
+    ((10, 1, 34, 0, 0), (16, 1, 28, 0, 0), (22, 1, 22, 0, 0), (28, 1, 16, 0, 0)), # 2
+    ((15, 1, 55, 0, 0), (26, 1, 44, 0, 0), (18, 2, 17, 0, 0), (22, 2, 13, 0, 0)), # 3
+    ((20, 1, 80, 0, 0), (18, 2, 32, 0, 0), (26, 2, 24, 0, 0), (16, 4, 9, 0, 0)), # 4
+    ((26, 1, 108, 0, 0), (24, 2, 43, 0, 0), (18, 2, 15, 2, 16), (22, 2, 11, 2, 12)), # 5
+    ((18, 2, 68, 0, 0), (16, 4, 27, 0, 0), (24, 4, 19, 0, 0), (28, 4, 15, 0, 0)), # 6
+    ((20, 2, 78, 0, 0), (18, 4, 31, 0, 0), (18, 2, 14, 4, 15), (26, 4, 13, 1, 14)), # 7
+    ((24, 2, 97, 0, 0), (22, 2, 38, 2, 39), (22, 4, 18, 2, 19), (26, 4, 14, 2, 15)), # 8
+    ((30, 2, 116, 0, 0), (22, 3, 36, 2, 37), (20, 4, 16, 4, 17), (24, 4, 12, 4, 13)), # 9
+    ((18, 2, 68, 2, 69), (26, 4, 43, 1, 44), (24, 6, 19, 2, 20), (28, 6, 15, 2, 16)), # 10
+    ((20, 4, 81, 0, 0), (30, 1, 50, 4, 51), (28, 4, 22, 4, 23), (24, 3, 12, 8, 13)), # 11
+    ((24, 2, 92, 2, 93), (22, 6, 36, 2, 37), (26, 4, 20, 6, 21), (28, 7, 14, 4, 15)), # 12
+    ((26, 4, 107, 0, 0), (22, 8, 37, 1, 38), (24, 8, 20, 4, 21), (22, 12, 11, 4, 12)), # 13
+    ((30, 3, 115, 1, 116), (24, 4, 40, 5, 41), (20, 11, 16, 5, 17), (24, 11, 12, 5, 13)), # 14
+    ((22, 5, 87, 1, 88), (24, 5, 41, 5, 42), (30, 5, 24, 7, 25), (24, 11, 12, 7, 13)), # 15
+    ((24, 5, 98, 1, 99), (28, 7, 45, 3, 46), (24, 15, 19, 2, 20), (30, 3, 15, 13, 16)), # 16
+    ((28, 1, 107, 5, 108), (28, 10, 46, 1, 47), (28, 1, 22, 15, 23), (28, 2, 14, 17, 15)), # 17
+    ((30, 5, 120, 1, 121), (26, 9, 43, 4, 44), (28, 17, 22, 1, 23), (28, 2, 14, 19, 15)), # 18
+    ((28, 3, 113, 4, 114), (26, 3, 44, 11, 45), (26, 17, 21, 4, 22), (26, 9, 13, 16, 14)), # 19
+    ((28, 3, 107, 5, 108), (26, 3, 41, 13, 42), (30, 15, 24, 5, 25), (28, 15, 15, 10, 16)), # 20
+    ((28, 4, 116, 4, 117), (26, 17, 42, 0, 0), (28, 17, 22, 6, 23), (30, 19, 16, 6, 17)), # 21
+    ((28, 2, 111, 7, 112), (28, 17, 46, 0, 0), (30, 7, 24, 16, 25), (24, 34, 13, 0, 0)), # 22
+    ((30, 4, 121, 5, 122), (28, 4, 47, 14, 48), (30, 11, 24, 14, 25), (30, 16, 15, 14, 16)), # 23
+    ((30, 6, 117, 4, 118), (28, 6, 45, 14, 46), (30, 11, 24, 16, 25), (30, 30, 16, 2, 17)), # 24
+    ((26, 8, 106, 4, 107), (28, 8, 47, 13, 48), (30, 7, 24, 22, 25), (30, 22, 15, 13, 16)), # 25
+    ((28, 10, 114, 2, 115), (28, 19, 46, 4, 47), (28, 28, 22, 6, 23), (30, 33, 16, 4, 17)), # 26
+    ((30, 8, 122, 4, 123), (28, 22, 45, 3, 46), (30, 8, 23, 26, 24), (30, 12, 15, 28, 16)), # 27
+    ((30, 3, 117, 10, 118), (28, 3, 45, 23, 46), (30, 4, 24, 31, 25), (30, 11, 15, 31, 16)), # 28
+    ((30, 7, 116, 7, 117), (28, 21, 45, 7, 46), (30, 1, 23, 37, 24), (30, 19, 15, 26, 16)), # 29
+    ((30, 5, 115, 10, 116), (28, 19, 47, 10, 48), (30, 15, 24, 25, 25), (30, 23, 15, 25, 16)), # 30
+    ((30, 13, 115, 3, 116), (28, 2, 46, 29, 47), (30, 42, 24, 1, 25), (30, 23, 15, 28, 16)), # 31
+    ((30, 17, 115, 0, 0), (28, 10, 46, 23, 47), (30, 10, 24, 35, 25), (30, 19, 15, 35, 16)), # 32
+    ((30, 17, 115, 1, 116), (28, 14, 46, 21, 47), (30, 29, 24, 19, 25), (30, 11, 15, 46, 16)), # 33
+    ((30, 13, 115, 6, 116), (28, 14, 46, 23, 47), (30, 44, 24, 7, 25), (30, 59, 16, 1, 17)), # 34
+    ((30, 12, 121, 7, 122), (28, 12, 47, 26, 48), (30, 39, 24, 14, 25), (30, 22, 15, 41, 16)), # 35
+    ((30, 6, 121, 14, 122), (28, 6, 47, 34, 48), (30, 46, 24, 10, 25), (30, 2, 15, 64, 16)), # 36
+    ((30, 17, 122, 4, 123), (28, 29, 46, 14, 47), (30, 49, 24, 10, 25), (30, 24, 15, 46, 16)), # 37
+    ((30, 4, 122, 18, 123), (28, 13, 46, 32, 47), (30, 48, 24, 14, 25), (30, 42, 15, 32, 16)), # 38
+    ((30, 20, 117, 4, 118), (28, 40, 47, 7, 48), (30, 43, 24, 22, 25), (30, 10, 15, 67, 16)), # 39
+    ((30, 19, 118, 6, 119), (28, 18, 47, 31, 48), (30, 34, 24, 34, 25), (30, 20, 15, 61, 16)), # 40
+)
+
+# Total number of data codewords, indexed the same way as EC_BLOCKS
+DATA_CODEWORDS = (None,) + tuple(
+    tuple(b1 * d1 + b2 * d2 for _, b1, d1, b2, d2 in EC_BLOCKS[version]) for version in range(1, 41)
+)
+
+# Number of bits of the character count indicator for versions 1-9, 10-26 and 27-40
+CHARACTER_COUNT_BITS = {
+    'Numeric': (10, 12, 14),
+    'Alphanumeric': (9, 11, 13),
+    'Byte': (8, 16, 16),
+    'Kanji': (8, 10, 12)
+}
+
+def version_class(version):
+    # Returns the index used by CHARACTER_COUNT_BITS for the given version
+    if version <= 9:
+        return 0
+    if version <= 26:
+        return 1
+    return 2
+
+
+# Versions covered by each index of CHARACTER_COUNT_BITS, as (first version, last version + 1)
+VERSION_CLASSES = ((1, 10), (10, 27), (27, 41))
+
+# Capacity index: CAPACITY_BITS[EC_INDEX[ec_level]][version] is the number of data bits of that version
+# Capacities grow with the version, so the smallest version that fits is found with a binary search
+CAPACITY_BITS = tuple(
+    [0] + [8 * DATA_CODEWORDS[version][ec] for version in range(1, 41)] for ec in range(4)
+)
+
+def encoded_bits(mode, length):
+    # Returns the number of bits used by ´length´ characters (or bytes, for the Byte mode) encoded in the given mode
+    if mode == 'Numeric':
+        return 10 * (length // 3) + (0, 4, 7)[length % 3]
+    if mode == 'Alphanumeric':
+        return 11 * (length // 2) + 6 * (length % 2)
+    if mode == 'Byte':
+        return 8 * length
+    return 13 * length # Kanji
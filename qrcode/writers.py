@@ -0,0 +1,131 @@
+import os
+import struct
+import zlib
+
+from .bits import Symbol
+
+
+#region ---- WRITERS ----
+# Every writer takes a Symbol or a matrix of modules (1 is black) and returns the bytes of the file
+# scale is the number of pixels per module and border the width of the quiet zone, in modules
+# If no border is given, a Symbol gets the 4-module quiet zone and a matrix is written as is, since the matrix returned
+# by QRCode.build already has it
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+def module_rows(code, border=None):
+    # Returns the width in modules and the rows of the code as integers, the leftmost module being the most
+    # significant bit and 1 being black. The quiet zone is included
+    symbol = code if isinstance(code, Symbol) else Symbol.from_matrix(code)
+    if border is None:
+        border = 4 if isinstance(code, Symbol) else 0
+
+    pad = 8 * symbol.stride - symbol.size
+    rows = [0] * border
+    for i in range(symbol.size):
+        rows.append((int.from_bytes(symbol.row_bytes(i), 'big') >> pad) << border)
+    rows += [0] * border
+    return symbol.size + 2 * border, rows
+
+
+def scaled_rows(code, scale, border):
+    # Same as module_rows, with every module repeated ´scale´ times horizontally (the rows are not repeated)
+    width, rows = module_rows(code, border)
+    if scale == 1:
+        return width, rows
+    widen = str.maketrans({'0': '0' * scale, '1': '1' * scale})
+    return width * scale, [int(format(row, f'0{width}b').translate(widen), 2) for row in rows]
+
+
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def to_png(code, scale=1, border=None, compresslevel=9):
+    # 1-bit grayscale PNG, where 0 is black. Every scanline starts with the filter type 0 (None)
+    width, rows = scaled_rows(code, scale, border)
+    stride = (width + 7) // 8
+    pad = 8 * stride - width
+    white = (1 << width) - 1
+
+    raw = bytearray()
+    for row in rows:
+        line = b'\x00' + ((white ^ row) << pad).to_bytes(stride, 'big')
+        raw += line * scale
+
+    header = struct.pack('>IIBBBBB', width, width, 1, 0, 0, 0, 0)
+    return (PNG_SIGNATURE + png_chunk(b'IHDR', header) + png_chunk(b'IDAT', zlib.compress(bytes(raw), compresslevel))
+            + png_chunk(b'IEND', b''))
+
+
+def to_pbm(code, scale=1, border=None):
+    # Binary PBM (P4), 8 pixels per byte and 1 is black, like the rows of a Symbol
+    width, rows = scaled_rows(code, scale, border)
+    stride = (width + 7) // 8
+    pad = 8 * stride - width
+
+    data = bytearray(b'P4\n%d %d\n' % (width, width))
+    for row in rows:
+        data += (row << pad).to_bytes(stride, 'big') * scale
+    return bytes(data)
+
+
+# Binary digits of a row to PGM pixels, 0 (black) for the dark modules and 255 for the light ones
+DIGITS_TO_GRAY = bytes.maketrans(b'01', b'\xff\x00')
+
+def to_pgm(code, scale=1, border=None):
+    # Binary PGM (P5) with one byte per pixel
+    width, rows = scaled_rows(code, scale, border)
+
+    data = bytearray(b'P5\n%d %d\n255\n' % (width, width))
+    for row in rows:
+        data += format(row, f'0{width}b').encode().translate(DIGITS_TO_GRAY) * scale
+    return bytes(data)
+
+
+def to_svg(code, scale=1, border=None):
+    # SVG with a single path in module units. Consecutive black modules of a row are merged into one rectangle
+    width, rows = module_rows(code, border)
+    size = width * scale
+
+    path = []
+    for y, row in enumerate(rows):
+        x = 0
+        while row:
+            skip = width - x - row.bit_length() # White modules before the next run
+            x += skip
+            row &= (1 << (width - x)) - 1
+            run = (width - x) - ((~row & ((1 << (width - x)) - 1)).bit_length()) # Black modules in the run
+            path.append(f'M{x} {y}h{run}v1h-{run}z')
+            x += run
+            row &= (1 << (width - x)) - 1
+
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {width} {width}" '
+            f'shape-rendering="crispEdges">'
+            f'<rect width="{width}" height="{width}" fill="#fff"/>'
+            f'<path d="{"".join(path)}" fill="#000"/></svg>\n').encode()
+
+
+WRITERS = {
+    'png': to_png,
+    'pbm': to_pbm,
+    'pgm': to_pgm,
+    'svg': to_svg
+}
+
+def save(code, path, scale=1, border=None, kind=None):
+    # Writes the code to a path or a binary file object. The kind of file is taken from the extension if not given
+    if kind is None:
+        kind = os.path.splitext(getattr(path, 'name', path))[1][1:].lower()
+    if kind not in WRITERS:
+        raise ValueError(f'unknown file type {kind!r}, expected one of {", ".join(WRITERS)}')
+
+    data = WRITERS[kind](code, scale, border)
+    if hasattr(path, 'write'):
+        path.write(data)
+    else:
+        with open(path, 'wb') as file:
+            file.write(data)
+
+#endregion
@@ -0,0 +1,56 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from qrcode.archives import read_frames, write_archive, write_frames, write_tar, write_zip
+from qrcode.batch import encode_many
+from qrcode.writers import to_png, to_svg
+
+
+@pytest.fixture(scope='module')
+def codes():
+    return list(encode_many([f'payload {i}' for i in range(12)], 'M'))
+
+
+@pytest.mark.parametrize('compression', ['', 'gz', 'xz'])
+def test_tar_round_trip(codes, compression):
+    stream = io.BytesIO()
+    assert write_tar(iter(codes), stream, 'png', 2, compression=compression) == len(codes)
+    stream.seek(0)
+    with tarfile.open(fileobj=stream, mode='r:' + (compression or '')) as archive:
+        members = archive.getmembers()
+        assert [member.name for member in members] == [f'{i:08d}.png' for i in range(len(codes))]
+        assert [archive.extractfile(member).read() for member in members] == [to_png(code, 2) for code in codes]
+
+
+def test_zip_round_trip(codes):
+    stream = io.BytesIO()
+    names = [f'code-{i}.svg' for i in range(len(codes))]
+    assert write_zip(codes, stream, 'svg', names=names) == len(codes)
+    with zipfile.ZipFile(stream) as archive:
+        assert archive.namelist() == names
+        assert [archive.read(name) for name in names] == [to_svg(code) for code in codes]
+
+
+def test_frames_round_trip(codes):
+    stream = io.BytesIO()
+    assert write_frames(codes, stream, 'png') == len(codes)
+    stream.seek(0)
+    assert list(read_frames(stream)) == [to_png(code) for code in codes]
+
+    for truncated in (stream.getvalue()[:2], stream.getvalue()[:-1]):
+        with pytest.raises(ValueError):
+            list(read_frames(io.BytesIO(truncated)))
+
+
+def test_write_archive_by_extension(codes, tmp_path):
+    assert write_archive(codes, str(tmp_path / 'codes.tar.gz')) == len(codes)
+    with tarfile.open(tmp_path / 'codes.tar.gz') as archive:
+        assert len(archive.getnames()) == len(codes)
+    assert write_archive(codes, str(tmp_path / 'codes.zip')) == len(codes)
+    assert zipfile.is_zipfile(tmp_path / 'codes.zip')
+    assert write_archive(codes, str(tmp_path / 'codes.frames')) == len(codes)
+    with open(tmp_path / 'codes.frames', 'rb') as file:
+        assert len(list(read_frames(file))) == len(codes)
@@ -0,0 +1,40 @@
+import random
+
+from qrcode.batch import encode_many, encode_many_parallel, render_many
+from qrcode.bits import matrix_from_bytes
+from qrcode.core import QRCode
+
+
+def payloads(count):
+    random.seed(6)
+    return [f'https://example.com/p/{random.randrange(10 ** 9)}?q=' + 'x' * random.randint(0, 150)
+            for _ in range(count)]
+
+
+def test_encode_many_matches_build():
+    data = payloads(30) + ['0123456789', 'HELLO WORLD']
+    for ec_level in 'LMQH':
+        assert list(encode_many(iter(data), ec_level)) == [QRCode(item, ec_level=ec_level).build() for item in data]
+    assert list(encode_many(['HELLO'], 'M', 'Alphanumeric', 3)) == [QRCode('HELLO', 'Alphanumeric', 3, 'M').build()]
+
+
+def test_encode_many_parallel_matches_encode_many():
+    data = payloads(120)
+    serial = [[list(row) for row in matrix] for matrix in encode_many(data, 'Q')]
+    assert list(encode_many_parallel(data, 'Q', processes=2, chunksize=16)) == serial
+
+    packed = list(encode_many_parallel(data[:10], 'Q', processes=2, chunksize=3, packed=True))
+    assert [matrix_from_bytes(bytes_, size) for size, bytes_ in packed] == serial[:10]
+    assert list(encode_many_parallel(iter([]), processes=2)) == []
+
+
+def test_render_many_reports_errors_in_order():
+    data = payloads(40)
+    data[7] = 'x' * 5000 # Does not fit
+    serial = list(render_many(data, 'png', 2, 4, 'L', None, None, 1, 8))
+    assert list(render_many(data, 'png', 2, 4, 'L', None, None, 2, 8)) == serial
+    assert isinstance(serial[7], str)
+    assert all(isinstance(result, bytes) for i, result in enumerate(serial) if i != 7)
+
+    numeric = list(render_many(['123', 'abc'], mode='Numeric'))
+    assert isinstance(numeric[0], bytes) and 'Numeric' in numeric[1]
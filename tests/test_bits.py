@@ -0,0 +1,42 @@
+import pytest
+
+from qrcode.bits import BitBuffer, Symbol, matrix_from_bytes, matrix_to_bytes
+from qrcode.core import QRCode
+
+
+def test_bit_buffer():
+    buffer = BitBuffer()
+    buffer.append_bits(0b101, 3)
+    buffer.append_bytes(b'\xff')
+    buffer.append_bits(0, 5)
+    assert len(buffer) == 16
+    assert list(buffer) == [1, 0, 1] + [1] * 8 + [0] * 5
+    assert buffer.to_bytes() == b'\xbf\xe0'
+
+
+def test_symbol_round_trip():
+    code = QRCode('https://example.com/' + 'x' * 80, ec_level='M')
+    code.build()
+    symbol = code.symbol()
+    matrix = [list(row[4:-4]) for row in code.matrix[4:-4]]
+    assert symbol.to_matrix() == matrix
+    assert Symbol.from_matrix(matrix) == symbol
+    assert all(symbol.get(row, column) == matrix[row][column]
+               for row in range(symbol.size) for column in range(symbol.size))
+    assert symbol.is_function(0, 0) and not symbol.is_function(symbol.size - 1, symbol.size - 1)
+
+    copy = Symbol(symbol.size)
+    for row in range(symbol.size):
+        for column in range(symbol.size):
+            copy.set(row, column, symbol.get(row, column))
+    assert copy == symbol
+    copy.set(0, 0, 0)
+    assert copy != symbol
+
+    assert matrix_from_bytes(matrix_to_bytes(matrix), len(matrix)) == matrix
+
+
+def test_slots():
+    code = QRCode('1')
+    with pytest.raises(AttributeError):
+        code.other = 1
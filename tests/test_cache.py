@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from qrcode.cache import SymbolCache
+from qrcode.core import QRCode
+from qrcode.diskcache import INDEX_RECORD, DiskCache
+from qrcode.writers import to_png
+
+
+def built_symbol(data, ec_level='L'):
+    code = QRCode(data, ec_level=ec_level)
+    code.build()
+    return code.symbol()
+
+
+def test_symbol_cache():
+    cache = SymbolCache(maxsize=2)
+    assert cache.symbol('a') == built_symbol('a')
+    assert cache.symbol('a') is cache.symbol('a')
+    cache.symbol('b')
+    cache.symbol('c') # Evicts 'a'
+    assert cache.stats()['symbols'] == {'hits': 2, 'misses': 3, 'evictions': 1, 'size': 2}
+    cache.symbol('a')
+    assert cache.stats()['symbols']['misses'] == 4
+
+
+def test_rendered_files_are_counted_apart():
+    cache = SymbolCache(maxrendered=4)
+    assert cache.render('x', scale=2) == to_png(built_symbol('x'), 2)
+    cache.render('x', scale=2)
+    stats = cache.stats()
+    assert stats['rendered'] == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+    assert stats['symbols'] == {'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1}
+
+    cache.clear()
+    assert cache.get_rendered('x', scale=2) is None
+    cache.put_rendered(b'file', 'x', scale=2)
+    assert cache.get_rendered('x', scale=2) == b'file'
+
+
+def test_disk_cache(tmp_path):
+    payloads = [f'https://example.com/{i}' for i in range(20)] + ['x' * 300]
+    with DiskCache(tmp_path) as cache:
+        symbols = [cache.symbol(data, ec_level='Q') for data in payloads]
+        assert symbols == [built_symbol(data, 'Q') for data in payloads]
+        assert cache.symbol(payloads[0], ec_level='Q') == symbols[0]
+        assert cache.stats()['hits'] == 1
+
+    with DiskCache(tmp_path) as cache: # The codes are still there after reopening the cache
+        assert [cache.symbol(data, ec_level='Q') for data in payloads] == symbols
+        assert cache.stats() == {'hits': len(payloads), 'misses': 0, 'symbols': len(payloads)}
+
+
+def fill_disk_cache(directory, payloads):
+    # Runs in a worker process
+    with DiskCache(directory) as cache:
+        for data in payloads:
+            cache.packed(data)
+
+
+def test_disk_cache_shared_by_processes(tmp_path):
+    # Processes missing the same keys at the same time must not store a code twice
+    payloads = [f'https://example.com/{i}' for i in range(90)]
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(fill_disk_cache, [tmp_path] * 4, [payloads[k:] + payloads[:k] for k in (0, 0, 45, 45)]))
+
+    assert os.path.getsize(tmp_path / 'index.bin') == INDEX_RECORD.size * len(payloads)
+    record = DiskCache(tmp_path).record_size(2)
+    assert os.path.getsize(tmp_path / 'v02.bin') == record * len(payloads)
+    with DiskCache(tmp_path) as cache:
+        assert [cache.symbol(data) for data in payloads] == [built_symbol(data) for data in payloads]
+        assert cache.stats()['misses'] == 0
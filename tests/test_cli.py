@@ -0,0 +1,78 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from qrcode import cli
+from qrcode.archives import read_frames
+from qrcode.batch import render_many
+
+
+def rendered(data, kind='png'):
+    return list(render_many(data, kind, 4, 4))
+
+
+def test_lines_to_directory(tmp_path):
+    source = tmp_path / 'input.txt'
+    source.write_text('HELLO\r\n\n12345\nhttps://example.com/\n', newline='')
+    assert cli.main([str(source), '-o', str(tmp_path / 'out'), '-j', '1']) == 0
+    files = sorted(tmp_path.joinpath('out').iterdir())
+    assert [path.name for path in files] == ['00000000.png', '00000001.png', '00000002.png']
+    assert [path.read_bytes() for path in files] == rendered(['HELLO', '12345', 'https://example.com/'])
+
+
+def test_csv_columns_with_names(tmp_path, capsys):
+    source = tmp_path / 'input.csv'
+    source.write_text('id;url\na;https://a.example\nb;https://b.example\nshort\n../c;https://c.example\n'
+                      ';https://d.example\nb;https://e.example\n')
+    status = cli.main([str(source), '-c', 'url', '--name-column', 'id', '--delimiter', ';', '-f', 'svg',
+                       '-o', str(tmp_path / 'out'), '-j', '2', '--chunksize', '2'])
+    assert status == 1 # The short row and the duplicate name are reported
+    errors = capsys.readouterr().err
+    assert "line 4: no payload in column 'url', skipped" in errors
+    assert 'b.svg: duplicate name, skipped' in errors
+
+    # The directory part of a name is dropped and an empty name takes the running number of its payload
+    files = {path.name: path.read_bytes() for path in tmp_path.joinpath('out').iterdir()}
+    assert sorted(files) == ['00000003.svg', 'a.svg', 'b.svg', 'c.svg']
+    assert [files[name] for name in ('a.svg', 'b.svg', 'c.svg', '00000003.svg')] == rendered(
+        ['https://a.example', 'https://b.example', 'https://c.example', 'https://d.example'], 'svg')
+
+
+@pytest.mark.parametrize('arguments, message', [
+    (['-c', '5'], "no column '5', the first row has 2 columns"),
+    (['-c', '0', '--name-column', '2'], "no column '2', the first row has 2 columns"),
+    (['-c', 'url'], "no column 'url' in the header"),
+])
+def test_missing_columns_fail(tmp_path, arguments, message):
+    source = tmp_path / 'input.csv'
+    source.write_text('HELLO,a\nWORLD,b\n')
+    with pytest.raises(SystemExit, match=message):
+        cli.main([str(source), '-o', str(tmp_path / 'out.zip'), '-j', '1'] + arguments)
+    assert not tmp_path.joinpath('out.zip').exists()
+
+
+@pytest.mark.parametrize('name', ['codes.tar.gz', 'codes.zip'])
+def test_archives(tmp_path, name):
+    source = tmp_path / 'input.txt'
+    source.write_text('one\ntwo\nthree\n')
+    output = tmp_path / name
+    assert cli.main([str(source), '-o', str(output), '-s', '2', '-j', '1']) == 0
+    if name.endswith('.zip'):
+        with zipfile.ZipFile(output) as archive:
+            files = [(info.filename, archive.read(info)) for info in archive.infolist()]
+    else:
+        with tarfile.open(output) as archive:
+            files = [(member.name, archive.extractfile(member).read()) for member in archive.getmembers()]
+    assert [file_name for file_name, _ in files] == ['00000000.png', '00000001.png', '00000002.png']
+    assert [data for _, data in files] == list(render_many(['one', 'two', 'three'], 'png', 2, 4))
+
+
+def test_frames_on_stdout(tmp_path, capsysbinary):
+    source = tmp_path / 'input.txt'
+    source.write_text('one\n' + 'x' * 5000 + '\nthree\n')
+    assert cli.main([str(source), '-o', '-', '-j', '1']) == 1 # The long payload does not fit
+    captured = capsysbinary.readouterr()
+    assert list(read_frames(io.BytesIO(captured.out))) == rendered(['one', 'three'])
+    assert b'2 codes written to -' in captured.err
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from qrcode.core import QRCode
+from qrcode.galois import GF_EXP, GF_LOG, gf_div, gf_div_vec, gf_mul, gf_mul_vec, generator_poly, poly_mult, rs_encode
+from qrcode.tables import EC_BLOCKS, EC_INDEX
+
+
+def naive_mul(a, b):
+    # Carry-less multiplication reduced modulo x^8 + x^4 + x^3 + x^2 + 1 (285), without the tables
+    product = 0
+    while b:
+        if b & 1:
+            product ^= a
+        b >>= 1
+        a <<= 1
+        if a & 256:
+            a ^= 285
+    return product
+
+
+def naive_remainder(message, n_code):
+    # Remainder of message(x) * x^n_code divided by the generator polynomial, by schoolbook long division
+    generator = [1]
+    for i in range(n_code):
+        root = 1
+        for _ in range(i):
+            root = naive_mul(root, 2)
+        # Multiplying by (x - 2^i), highest exponent first
+        generator = [a ^ naive_mul(b, root) for a, b in zip(generator + [0], [0] + generator)]
+
+    remainder = list(message) + [0] * n_code
+    for i in range(len(message)):
+        factor = remainder[i]
+        if factor:
+            for j, coefficient in enumerate(generator):
+                remainder[i + j] ^= naive_mul(coefficient, factor)
+    return remainder[-n_code:]
+
+
+def built_codewords(data, version, ec_level):
+    code = QRCode(data, 'Byte', version, ec_level)
+    code.encode_data()
+    code.terminator()
+    code.padding()
+    code.data_codewords()
+    return code
+
+
+def test_tables_are_inverse():
+    assert sorted(GF_EXP[:255]) == list(range(1, 256))
+    for value in range(1, 256):
+        assert GF_EXP[GF_LOG[value]] == value
+    assert GF_EXP[255:510] == GF_EXP[:255]
+
+
+def test_gf_mul_and_div():
+    for a in range(256):
+        for b in range(256):
+            product = gf_mul(a, b)
+            assert product == naive_mul(a, b)
+            if b:
+                assert gf_div(product, b) == a
+    with pytest.raises(ZeroDivisionError):
+        gf_div(1, 0)
+
+
+def test_gf_vectors():
+    values = list(range(256))
+    for scalar in (0, 1, 2, 29, 255):
+        assert gf_mul_vec(values, scalar) == [naive_mul(value, scalar) for value in values]
+        if scalar:
+            assert gf_div_vec(gf_mul_vec(values, scalar), scalar) == values
+    with pytest.raises(ZeroDivisionError):
+        gf_div_vec(values, 0)
+
+
+def test_poly_mult():
+    # (x - 2^0)(x - 2^1) = x^2 + 3x + 2, in alpha notation [1, 25, 0]
+    assert poly_mult([0, 0], [1, 0]) == [1, 25, 0]
+
+
+def test_generator_poly():
+    # The generator of n codewords has n + 1 coefficients and the leading one is 2^0
+    for n_code in (7, 10, 30):
+        poly = generator_poly(n_code)
+        assert len(poly) == n_code + 1
+        assert poly[-1] == 0
+
+
+def test_rs_encode_hello_world():
+    # HELLO WORLD as a 1-M code, from the worked example of the standard
+    data = bytes([32, 91, 11, 120, 209, 114, 220, 77, 67, 64, 236, 17, 236, 17, 236, 17])
+    assert list(rs_encode(data, 10)) == [196, 35, 39, 119, 235, 215, 231, 226, 93, 23]
+
+
+def test_rs_encode_matches_long_division():
+    random.seed(1)
+    for n_code in sorted(set(entry[0] for row in EC_BLOCKS[1:] for entry in row)):
+        message = bytes(random.randrange(256) for _ in range(random.randint(1, 60)))
+        assert list(rs_encode(message, n_code)) == naive_remainder(message, n_code)
+
+
+def test_rs_encode_matches_reference():
+    # get_eccodewords_reference treats the data as a single block, so only single-block codes are compared
+    random.seed(2)
+    for version in range(1, 6):
+        for ec_level in EC_INDEX:
+            if EC_BLOCKS[version][EC_INDEX[ec_level]][1:4:2] != (1, 0):
+                continue
+            data = bytes(random.randrange(256) for _ in range(version * 5))
+            code = built_codewords(data, version, ec_level)
+            assert [list(block) for block in code.get_eccodewords()] == [code.get_eccodewords_reference()]
+
+
+def test_rs_encode_blocks():
+    # Every block of a multi-block code gets its own error correction codewords
+    code = built_codewords(b'x' * 300, 20, 'Q')
+    blocks = code.g1 + code.g2
+    assert len(blocks) == 20
+    assert [list(ec) for ec in code.get_eccodewords()] == [naive_remainder(block, code.n_eccodewords)
+                                                          for block in blocks]
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from qrcode import masks
+from qrcode.core import QRCode
+from qrcode.masks import pack_matrix, penalty_score
+
+
+def naive_penalty(matrix):
+    # The four conditions of the standard, module by module
+    size = len(matrix)
+    score = 0
+    for lines in (matrix, [list(column) for column in zip(*matrix)]):
+        for line in lines:
+            run = 1
+            for i in range(1, size + 1):
+                if i < size and line[i] == line[i - 1]:
+                    run += 1
+                    continue
+                if run >= 5:
+                    score += run - 2
+                run = 1
+            for i in range(size - 10):
+                window = ''.join(str(module) for module in line[i:i + 11])
+                if window in ('10111010000', '00001011101'):
+                    score += 40
+
+    for row in range(size - 1):
+        for column in range(size - 1):
+            if (matrix[row][column] == matrix[row + 1][column] == matrix[row][column + 1]
+                    == matrix[row + 1][column + 1]):
+                score += 3
+
+    dark = sum(sum(line) for line in matrix)
+    score += 10 * (abs(20 * dark - 10 * size * size) // (size * size))
+    return score
+
+
+def random_matrices():
+    random.seed(5)
+    for size in (21, 25, 45, 57):
+        for density in (0.2, 0.5, 0.8):
+            yield [[int(random.random() < density) for _ in range(size)] for _ in range(size)]
+    # Real symbols have long runs and finder-like windows
+    for data in ('HELLO WORLD', 'https://example.com/' + 'x' * 120):
+        code = QRCode(data, ec_level='M')
+        code.build()
+        yield [list(row[4:-4]) for row in code.matrix[4:-4]]
+
+
+def test_penalty_score_matches_naive():
+    for matrix in random_matrices():
+        rows, cols = pack_matrix(matrix)
+        assert penalty_score(rows, cols, len(matrix)) == naive_penalty(matrix)
+
+
+def test_penalties_numpy_matches_naive():
+    np = pytest.importorskip('numpy')
+    for matrix in random_matrices():
+        matrices = np.array([matrix, [[1 - module for module in row] for row in matrix]], dtype=np.uint8)
+        assert list(masks.penalties_numpy(matrices)) == [naive_penalty(matrix) for matrix in matrices.tolist()]
+
+
+@pytest.mark.parametrize('data, ec_level', [
+    ('HELLO WORLD', 'Q'),
+    ('0123456789' * 30, 'L'),
+    ('https://example.com/' + 'x' * 400, 'M'),
+    ('漢字' * 50, 'H'),
+])
+def test_backends_agree(monkeypatch, data, ec_level):
+    pytest.importorskip('numpy')
+    results = []
+    for backend in ('numpy', 'python'):
+        monkeypatch.setattr(masks, 'BACKEND', backend)
+        code = QRCode(data, ec_level=ec_level)
+        results.append((code.build(), code.mask_number))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'python'])
+def test_given_mask(monkeypatch, backend):
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    monkeypatch.setattr(masks, 'BACKEND', backend)
+    code = QRCode('HELLO WORLD', ec_level='Q')
+    matrix = code.build()
+    for mask in range(8):
+        forced = QRCode('HELLO WORLD', ec_level='Q', mask=mask)
+        forced_matrix = forced.build()
+        assert forced.mask_number == mask
+        assert all(type(module) is int for row in forced_matrix for module in row)
+        if mask == code.mask_number:
+            assert forced_matrix == matrix
@@ -0,0 +1,122 @@
+import random
+from functools import lru_cache
+
+import pytest
+
+from qrcode.batch import encode_many
+from qrcode.core import QRCode
+from qrcode.segments import (SEGMENT_MODES, character_costs, segment_data, segment_payload, segments_bits,
+                             select_segments, select_version)
+from qrcode.tables import CAPACITY_BITS, CHARACTER_COUNT_BITS, EC_INDEX, encoded_bits, version_class
+
+
+def fits(mode, text):
+    try:
+        segment_payload(mode, text)
+    except ValueError:
+        return False
+    return True
+
+
+def brute_force_bits(data, vclass):
+    # Fewest bits over every split of the data into segments and every mode of each segment
+    @lru_cache(maxsize=None)
+    def best(start):
+        if start == len(data):
+            return 0
+        bits = float('inf')
+        for end in range(start + 1, len(data) + 1):
+            for mode in SEGMENT_MODES:
+                if fits(mode, data[start:end]):
+                    length = len(segment_payload(mode, data[start:end]))
+                    bits = min(bits, 4 + CHARACTER_COUNT_BITS[mode][vclass] + encoded_bits(mode, length) + best(end))
+        return bits
+
+    return best(0)
+
+
+def test_segmentation_matches_brute_force():
+    random.seed(3)
+    alphabet = '0123AZ $:az.é漢字'
+    for _ in range(400):
+        data = ''.join(random.choice(alphabet) for _ in range(random.randint(1, 9)))
+        costs = character_costs(data)
+        for vclass in range(3):
+            segments = segment_data(data, vclass, costs)
+            assert segments == segment_data(data, vclass)
+            assert segments_bits(segments, vclass) == brute_force_bits(data, vclass), (data, segments)
+
+
+def test_segments_join_back_to_the_data():
+    data = 'ABC0123456789012abcdef漢字漢字HELLO'
+    segments = segment_data(data, 0)
+    text = ''.join(payload.decode('utf-8') if mode == 'Byte' else payload for mode, payload in segments)
+    assert text == data
+    assert [mode for mode, _ in segments] == ['Alphanumeric', 'Numeric', 'Byte', 'Kanji', 'Alphanumeric']
+
+
+def test_bytes_without_a_mode():
+    # Bytes are not text, so they are encoded as a single Byte segment
+    code = QRCode(b'\x00\xffabc')
+    assert code.segments == [('Byte', b'\x00\xffabc')]
+    assert code.build() == QRCode(b'\x00\xffabc', 'Byte').build()
+    assert len(list(encode_many([b'abc', bytearray(b'123')]))) == 2
+    assert select_segments(b'', 'L') == (1, [])
+
+
+def test_select_version_is_the_smallest():
+    for mode, character in (('Numeric', '7'), ('Alphanumeric', 'Q'), ('Byte', 'q')):
+        for length in (1, 17, 100, 1000):
+            for ec_level in EC_INDEX:
+                try:
+                    version = select_version(mode, length, ec_level)
+                except ValueError:
+                    continue
+                capacity = CAPACITY_BITS[EC_INDEX[ec_level]]
+                segments = [(mode, character * length)]
+                assert segments_bits(segments, version_class(version)) <= capacity[version]
+                if version > 1:
+                    bits = segments_bits(segments, version_class(version - 1))
+                    assert bits is None or bits > capacity[version - 1]
+
+
+def test_select_segments_with_a_version():
+    version, segments = select_segments('HELLO WORLD', 'H', 2)
+    assert version == 2
+    with pytest.raises(ValueError, match='version 1 QR Code'):
+        select_segments('HELLO WORLD', 'H', 1)
+    with pytest.raises(ValueError, match='does not fit in a QR Code'):
+        select_segments('x' * 3000, 'H')
+
+
+@pytest.mark.parametrize('mode, data', [
+    ('Numeric', '12a'),
+    ('Numeric', '١٢٣'), # Digits of other scripts
+    ('Alphanumeric', 'hello'),
+    ('Kanji', 'A'),
+    ('Kanji', b'\x88\x9f'),
+    ('Unknown', '1'),
+])
+def test_explicit_mode_rejects_data(mode, data):
+    with pytest.raises(ValueError):
+        QRCode(data, mode)
+
+
+@pytest.mark.parametrize('arguments, message', [
+    ({'version': 0}, 'version must be'),
+    ({'version': 41}, 'version must be'),
+    ({'version': '1'}, 'version must be'),
+    ({'ec_level': 'X'}, 'error correction level must be'),
+    ({'ec_level': 'l'}, 'error correction level must be'),
+    ({'mask': 8}, 'mask must be'),
+    ({'mode': 'Numeric', 'version': 1, 'data': '1' * 100}, 'version 1 QR Code'),
+])
+def test_invalid_arguments(arguments, message):
+    arguments = {'data': '123', **arguments}
+    with pytest.raises(ValueError, match=message):
+        QRCode(**arguments)
+
+
+def test_version_and_level():
+    code = QRCode('123', 'Numeric', 40, 'H')
+    assert len(code.build()) == 177 + 8
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from qrcode import server
+from qrcode.core import QRCode
+from qrcode.server import MAX_BODY, QRClient, QRServer
+from qrcode.writers import to_png, to_svg
+
+
+def run(test, **options):
+    # Runs test(server, client) against a server with a thread pool on a free port
+    async def main():
+        qr_server = await QRServer(port=0, processes=False, **options).start()
+        client = QRClient(port=qr_server.port)
+        try:
+            return await test(qr_server, client)
+        finally:
+            await client.close()
+            await qr_server.close()
+
+    return asyncio.run(main())
+
+
+def built_symbol(data, *arguments):
+    code = QRCode(data, *arguments)
+    code.build()
+    return code.symbol()
+
+
+@pytest.fixture
+def blocked(monkeypatch):
+    # Makes the workers wait until the event is set, so requests stay in flight
+    event = threading.Event()
+    render_code = server.render_code
+
+    def blocked_render_code(*options):
+        event.wait(10)
+        return render_code(*options)
+
+    monkeypatch.setattr(server, 'render_code', blocked_render_code)
+    yield event
+    event.set()
+
+
+async def wait_for_requests(qr_server, count):
+    while qr_server.counters['requests'] < count:
+        await asyncio.sleep(0.01)
+
+
+def test_codes():
+    async def test(qr_server, client):
+        status, headers, body = await client.get('/qr?data=HELLO+WORLD&ec=q&scale=2')
+        assert (status, headers['content-type']) == (200, 'image/png')
+        assert body == to_png(built_symbol('HELLO WORLD', None, None, 'Q'), 2)
+        assert headers['connection'] == 'keep-alive'
+
+        status, headers, body = await client.post('/qr?format=svg&border=1&mode=Byte', 'ünïcode'.encode())
+        assert (status, headers['content-type']) == (200, 'image/svg+xml')
+        assert body == to_svg(built_symbol('ünïcode', 'Byte'), 4, 1)
+
+        status, _, body = await client.get('/stats')
+        assert status == 200 and json.loads(body)['built'] == 2
+
+    run(test)
+
+
+@pytest.mark.parametrize('target, message', [
+    ('/qr?data=abc&mode=Numeric', b'Numeric mode'),
+    ('/qr?data=abc&mode=Other', b'unknown mode'),
+    ('/qr?data=' + 'x' * 3000 + '&ec=H', b'does not fit'),
+    ('/qr?data=abc&version=41', b'version'),
+    ('/qr?data=abc&scale=0', b'scale'),
+    ('/qr?ec=M', b'missing data'),
+])
+def test_bad_requests(target, message):
+    async def test(qr_server, client):
+        status, headers, body = await client.get(target)
+        assert status == 400 and message in body
+        assert headers['connection'] == 'keep-alive' # The request was read whole, the next one can follow
+        assert (await client.get('/qr?data=ok'))[0] == 200
+
+    run(test)
+
+
+def test_not_found():
+    async def test(qr_server, client):
+        assert (await client.get('/other'))[0] == 404
+        assert (await client.request('PUT', '/qr?data=a'))[0] == 405
+
+    run(test)
+
+
+def test_identical_requests_are_coalesced(blocked):
+    async def test(qr_server, client):
+        clients = [QRClient(port=qr_server.port) for _ in range(5)]
+        requests = [asyncio.ensure_future(other.get('/qr?data=same')) for other in clients]
+        await wait_for_requests(qr_server, 5)
+        blocked.set()
+        responses = await asyncio.gather(*requests)
+        for other in clients:
+            await other.close()
+
+        assert len({body for _, _, body in responses}) == 1
+        assert all(status == 200 for status, _, _ in responses)
+        assert (qr_server.counters['built'], qr_server.counters['coalesced']) == (1, 4)
+
+    run(test, workers=2)
+
+
+def test_backpressure(blocked):
+    async def test(qr_server, client):
+        waiting = asyncio.ensure_future(client.get('/qr?data=first'))
+        await wait_for_requests(qr_server, 1)
+
+        other = QRClient(port=qr_server.port)
+        status, headers, _ = await other.get('/qr?data=second')
+        assert (status, headers['retry-after']) == (503, '1')
+        assert qr_server.counters['rejected'] == 1
+
+        blocked.set()
+        assert (await waiting)[0] == 200
+        assert (await other.get('/qr?data=second'))[0] == 200
+        await other.close()
+
+    run(test, max_pending=1)
+
+
+@pytest.mark.parametrize('length, status', [('-5', 400), ('abc', 400), ('1e3', 400), (str(MAX_BODY + 1), 413)])
+def test_bad_content_length(length, status):
+    async def test(qr_server, client):
+        reader, writer = await asyncio.open_connection('127.0.0.1', qr_server.port)
+        writer.write(f'POST /qr HTTP/1.1\r\nContent-Length: {length}\r\n\r\nabc'.encode())
+        response = await asyncio.wait_for(reader.read(), 5) # The server closes the connection after answering
+        writer.close()
+        assert response.startswith(f'HTTP/1.1 {status} '.encode())
+        assert b'Connection: close' in response
+
+    run(test)
+
+
+def test_server_errors(monkeypatch):
+    def broken_render_code(*options):
+        raise RuntimeError('broken')
+
+    monkeypatch.setattr(server, 'render_code', broken_render_code)
+
+    async def test(qr_server, client):
+        status, headers, body = await client.get('/qr?data=abc')
+        assert (status, body) == (500, b'RuntimeError: broken')
+        assert headers['connection'] == 'close'
+
+    run(test)
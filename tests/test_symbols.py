@@ -0,0 +1,274 @@
+import random
+
+import pytest
+
+from qrcode.core import QRCode
+from qrcode.tables import EC_BLOCKS
+
+# A small decoder written from the standard, sharing nothing with the encoder but the block table (checked in
+# test_tables.py). It reads a finished symbol back to its data, checking every function pattern, both copies of the
+# format and version information, the error correction codewords of every block and the padding on the way
+
+
+EXP = [0] * 510
+LOG = [0] * 256
+value = 1
+for i in range(255):
+    EXP[i] = EXP[i + 255] = value
+    LOG[value] = i
+    value <<= 1
+    if value & 256:
+        value ^= 285
+
+MASKS = (
+    lambda i, j: (i + j) % 2 == 0,
+    lambda i, j: i % 2 == 0,
+    lambda i, j: j % 3 == 0,
+    lambda i, j: (i + j) % 3 == 0,
+    lambda i, j: (i // 2 + j // 3) % 2 == 0,
+    lambda i, j: (i * j) % 2 + (i * j) % 3 == 0,
+    lambda i, j: ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+    lambda i, j: ((i + j) % 2 + (i * j) % 3) % 2 == 0,
+)
+
+ALPHANUMERIC = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:'
+
+
+def bch(data, data_bits, generator):
+    # Appends the remainder of data * x^(degree of generator) divided by the generator
+    degree = generator.bit_length() - 1
+    remainder = data << degree
+    for shift in range(data_bits - 1, -1, -1):
+        if remainder & (1 << (shift + degree)):
+            remainder ^= generator << shift
+    return (data << degree) | remainder
+
+
+FORMATS = {bch((ec_bits << 3) | mask, 5, 0b10100110111) ^ 0b101010000010010: (level, mask)
+           for level, ec_bits in zip('LMQH', (1, 0, 3, 2)) for mask in range(8)}
+
+
+def alignment_centers(version):
+    if version == 1:
+        return []
+    count = version // 7 + 2
+    step = 26 if version == 32 else (version * 4 + count * 2 + 1) // (count * 2 - 2) * 2
+    last = 17 + 4 * version - 7
+    positions = [6] + [last - i * step for i in range(count - 2, -1, -1)]
+    return [(row, column) for row in positions for column in positions
+            if (row, column) not in ((6, 6), (6, last), (last, 6))]
+
+
+def function_modules(version, size):
+    # Returns the set of modules that do not hold data
+    function = set()
+    for top, left in ((0, 0), (0, size - 7), (size - 7, 0)):
+        for i in range(-1, 8):
+            for j in range(-1, 8):
+                if 0 <= top + i < size and 0 <= left + j < size:
+                    function.add((top + i, left + j))
+    for i in range(9): # Format information, the dark module included
+        function.update(((8, i), (i, 8)))
+        if i < 8:
+            function.update(((8, size - 1 - i), (size - 1 - i, 8)))
+    for k in range(size):
+        function.update(((6, k), (k, 6)))
+    for row, column in alignment_centers(version):
+        function.update((row + i, column + j) for i in range(-2, 3) for j in range(-2, 3))
+    if version >= 7:
+        for i in range(6):
+            for j in range(3):
+                function.update(((i, size - 11 + j), (size - 11 + j, i)))
+    return function
+
+
+def check_patterns(matrix, version):
+    size = len(matrix)
+    for top, left in ((0, 0), (0, size - 7), (size - 7, 0)):
+        for i in range(7):
+            for j in range(7):
+                ring = max(abs(i - 3), abs(j - 3))
+                assert matrix[top + i][left + j] == (ring != 2)
+    for k in range(8, size - 8):
+        assert matrix[6][k] == matrix[k][6] == (k % 2 == 0)
+    for row, column in alignment_centers(version):
+        for i in range(-2, 3):
+            for j in range(-2, 3):
+                assert matrix[row + i][column + j] == (max(abs(i), abs(j)) != 1)
+    assert matrix[size - 8][8] == 1 # Dark module
+
+
+def read_format(matrix):
+    size = len(matrix)
+    first = [(8, i) for i in range(6)] + [(8, 7), (8, 8), (7, 8)] + [(i, 8) for i in range(5, -1, -1)]
+    second = [(size - 1 - i, 8) for i in range(7)] + [(8, size - 8 + i) for i in range(8)]
+    copies = [int(''.join(str(matrix[i][j]) for i, j in modules), 2) for modules in (first, second)]
+    assert copies[0] == copies[1]
+    return FORMATS[copies[0]]
+
+
+def read_version(matrix):
+    size = len(matrix)
+    version = (size - 17) // 4
+    if version >= 7:
+        bottom_left = sum(matrix[size - 11 + i % 3][i // 3] << i for i in range(18))
+        top_right = sum(matrix[i // 3][size - 11 + i % 3] << i for i in range(18))
+        assert bottom_left == top_right == bch(version, 6, 0b1111100100101)
+    return version
+
+
+def read_bits(matrix, version, mask):
+    size = len(matrix)
+    function = function_modules(version, size)
+    bits = []
+    upward = True
+    for right in range(size - 1, 0, -2):
+        if right <= 6:
+            right -= 1
+        for row in (range(size - 1, -1, -1) if upward else range(size)):
+            for column in (right, right - 1):
+                if (row, column) not in function:
+                    bits.append(matrix[row][column] ^ MASKS[mask](row, column))
+        upward = not upward
+    return bits
+
+
+def syndromes_are_zero(block, n_code):
+    for k in range(n_code):
+        value = 0
+        for codeword in block:
+            value = (EXP[LOG[value] + k] if value else 0) ^ codeword
+        if value:
+            return False
+    return True
+
+
+def read_segments(data, version):
+    bits = ''.join(format(codeword, '08b') for codeword in data)
+    vclass = 0 if version <= 9 else 1 if version <= 26 else 2
+    position = 0
+
+    def take(n):
+        nonlocal position
+        position += n
+        return int(bits[position - n:position], 2)
+
+    decoded = []
+    while len(bits) - position >= 4 and bits[position:position + 4] != '0000': # Up to the terminator
+        mode = take(4)
+        if mode == 1:
+            count = take((10, 12, 14)[vclass])
+            text = ''
+            for start in range(0, count, 3):
+                digits = min(3, count - start)
+                text += format(take((4, 7, 10)[digits - 1]), f'0{digits}d')
+            decoded.append(('Numeric', text))
+        elif mode == 2:
+            count = take((9, 11, 13)[vclass])
+            text = ''
+            for _ in range(count // 2):
+                pair = take(11)
+                text += ALPHANUMERIC[pair // 45] + ALPHANUMERIC[pair % 45]
+            if count % 2:
+                text += ALPHANUMERIC[take(6)]
+            decoded.append(('Alphanumeric', text))
+        elif mode == 4:
+            count = take((8, 16, 16)[vclass])
+            decoded.append(('Byte', bytes(take(8) for _ in range(count))))
+        elif mode == 8:
+            count = take((8, 10, 12)[vclass])
+            text = ''
+            for _ in range(count):
+                value = take(13)
+                code = (value // 0xC0 << 8) | (value % 0xC0)
+                code += 0x8140 if code + 0x8140 <= 0x9FFC else 0xC140
+                text += code.to_bytes(2, 'big').decode('shift_jis')
+            decoded.append(('Kanji', text))
+        else:
+            raise AssertionError(f'unknown mode indicator {mode:04b}')
+
+    # The terminator and the bits up to the next codeword are zeros, then the pad codewords alternate
+    end = min(len(bits), (position + 4 + 7) // 8 * 8)
+    assert set(bits[position:end]) <= {'0'}
+    pad = data[end // 8:]
+    assert list(pad) == [(0xEC, 0x11)[i % 2] for i in range(len(pad))]
+    return decoded
+
+
+def decode(matrix):
+    # Returns the EC level, the mask and the segments of a matrix without the quiet zone
+    matrix = [[int(module) for module in row] for row in matrix]
+    version = read_version(matrix)
+    check_patterns(matrix, version)
+    ec_level, mask = read_format(matrix)
+
+    bits = read_bits(matrix, version, mask)
+    assert bits[len(bits) // 8 * 8:] == [0] * (len(bits) % 8) # Remainder bits
+    codewords = [int(''.join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits) // 8 * 8, 8)]
+
+    n_code, blocks1, data1, blocks2, data2 = EC_BLOCKS[version]['LMQH'.index(ec_level)]
+    sizes = [data1] * blocks1 + [data2] * blocks2
+    blocks = [[] for _ in sizes]
+    position = 0
+    for i in range(max(sizes)):
+        for block, size in zip(blocks, sizes):
+            if i < size:
+                block.append(codewords[position])
+                position += 1
+    for _ in range(n_code):
+        for block in blocks:
+            block.append(codewords[position])
+            position += 1
+    assert position == len(codewords)
+    assert all(syndromes_are_zero(block, n_code) for block in blocks)
+
+    data = bytes(codeword for block, size in zip(blocks, sizes) for codeword in block[:size])
+    return ec_level, mask, read_segments(data, version)
+
+
+def joined(segments):
+    return ''.join(text.decode('utf-8') if mode == 'Byte' else text for mode, text in segments)
+
+
+def filling(version, ec_level, seed):
+    # Mixed data that nearly fills the given version, so every block is used
+    random.seed(seed)
+    pieces = ['0123456789' * 3, 'HELLO WORLD $%*+-./:', 'qr code ÿ ', '漢字テスト']
+    data = ''
+    while True:
+        piece = random.choice(pieces)[:random.randint(3, 30)]
+        try:
+            QRCode(data + piece, None, version, ec_level)
+        except ValueError:
+            return data
+        data += piece
+
+
+@pytest.mark.parametrize('version, ec_level', [
+    (1, 'M'), (2, 'L'), (5, 'Q'), (7, 'H'), (9, 'L'), (14, 'Q'), (21, 'M'), (27, 'H'), (32, 'L'), (40, 'L'), (40, 'H'),
+])
+def test_full_symbols_decode(version, ec_level):
+    data = filling(version, ec_level, version)
+    code = QRCode(data, None, version, ec_level)
+    matrix = code.build()
+    level, mask, segments = decode(row[4:-4] for row in matrix[4:-4])
+    assert (level, mask) == (ec_level, code.mask_number)
+    assert joined(segments) == data
+    assert [(mode, text) for mode, text in segments] == code.segments
+    if EC_BLOCKS[version]['LMQH'.index(ec_level)][3]:
+        assert code.g2 # The data was long enough to reach the blocks of group 2
+
+
+@pytest.mark.parametrize('data, mode, version, ec_level', [
+    ('HELLO WORLD', 'Alphanumeric', 1, 'Q'),
+    ('01234567', 'Numeric', 10, 'M'),
+    ('https://example.com/', 'Byte', 7, 'H'),
+    ('漢字', 'Kanji', 3, 'L'),
+])
+def test_padded_symbols_decode(data, mode, version, ec_level):
+    for mask in range(8):
+        code = QRCode(data, mode, version, ec_level, mask)
+        code.build()
+        level, mask_number, segments = decode(code.symbol().to_matrix())
+        assert (level, mask_number) == (ec_level, mask)
+        assert joined(segments) == data
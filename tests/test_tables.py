@@ -0,0 +1,100 @@
+from qrcode.core import QRCode
+from qrcode.patterns import format_positions, placement_order, reserved_modules, template_matrix
+from qrcode.tables import (ALIGNMENT_POSITIONS, CAPACITY_BITS, DATA_CODEWORDS, EC_BLOCKS, FORMAT_INFO, VERSION_INFO,
+                           VERSIONS_DIMENSIONS)
+
+
+def test_ec_blocks_fill_the_symbol():
+    # Data and error correction codewords of every block fill the data modules, leaving less than a codeword
+    for version in range(1, 41):
+        modules = len(placement_order(version)[0])
+        for n_code, blocks1, data1, blocks2, data2 in EC_BLOCKS[version]:
+            codewords = blocks1 * (data1 + n_code) + blocks2 * (data2 + n_code)
+            assert codewords == modules // 8
+            assert blocks2 == 0 or data2 == data1 + 1
+
+
+def test_data_codewords():
+    assert DATA_CODEWORDS[1] == (19, 16, 13, 9)
+    assert DATA_CODEWORDS[40] == (2956, 2334, 1666, 1276)
+    for version in range(2, 41):
+        for ec in range(4):
+            assert DATA_CODEWORDS[version][ec] > DATA_CODEWORDS[version - 1][ec]
+            assert CAPACITY_BITS[ec][version] == 8 * DATA_CODEWORDS[version][ec]
+
+
+def test_alignment_positions():
+    # Evenly spaced from the last row of the symbol minus 7, with the first gap taking whatever is left
+    assert ALIGNMENT_POSITIONS[1] == ()
+    for version in range(2, 41):
+        count = version // 7 + 2
+        step = 26 if version == 32 else (version * 4 + count * 2 + 1) // (count * 2 - 2) * 2
+        last = VERSIONS_DIMENSIONS[version] - 7
+        expected = (6,) + tuple(last - i * step for i in range(count - 2, -1, -1))
+        assert ALIGNMENT_POSITIONS[version] == expected
+
+
+def test_version_info():
+    # The 6 bits of the version followed by the BCH(18, 6) remainder, so each one differs from the others in at
+    # least 8 bits
+    assert set(VERSION_INFO) == set(range(7, 41))
+    assert VERSION_INFO[7] == 0b000111110010010100
+    assert VERSION_INFO[40] == 0b101000110001101001
+    values = list(VERSION_INFO.values())
+    for i, a in enumerate(values):
+        assert a >> 12 == i + 7
+        for b in values[i + 1:]:
+            assert (a ^ b).bit_count() >= 8
+
+
+def test_templates():
+    for version in (1, 2, 7, 21, 40):
+        size = VERSIONS_DIMENSIONS[version]
+        template = template_matrix(version)
+        reserved = reserved_modules(version)
+        # Only reserved modules are drawn
+        assert all(reserved[i] for i in range(size * size) if template[i])
+
+        positions = ALIGNMENT_POSITIONS[version]
+        centers = [(row, column) for row in positions for column in positions
+                   if (row, column) not in ((6, 6), (6, positions[-1]), (positions[-1], 6))]
+        assert len(centers) == (0 if version == 1 else len(positions) ** 2 - 3)
+        for row, column in centers:
+            pattern = [[template[(row + i) * size + column + j] for j in range(-2, 3)] for i in range(-2, 3)]
+            assert pattern == [[1, 1, 1, 1, 1], [1, 0, 0, 0, 1], [1, 0, 1, 0, 1], [1, 0, 0, 0, 1], [1, 1, 1, 1, 1]]
+
+        if version >= 7:
+            # The least significant bit is next to the corner of each block, both blocks are the same bits transposed
+            info = VERSION_INFO[version]
+            for i in range(18):
+                assert template[(size - 11 + i % 3) * size + i // 3] == (info >> i) & 1
+                assert template[(i // 3) * size + size - 11 + i % 3] == (info >> i) & 1
+
+
+def test_format_info():
+    assert format(FORMAT_INFO[('L', 4)], '015b') == '110011000101111'
+    assert format(FORMAT_INFO[('M', 0)], '015b') == '101010000010010' # The value that used to crash format_string
+    values = list(FORMAT_INFO.values())
+    assert len(set(values)) == 32
+    # BCH(15, 5) has a minimum distance of 7
+    for i, a in enumerate(values):
+        for b in values[i + 1:]:
+            assert (a ^ b).bit_count() >= 7
+
+
+def test_format_string():
+    for ec_level in 'LMQH':
+        for mask in range(8):
+            code = QRCode('1', ec_level=ec_level, mask=mask)
+            code.build()
+            assert code.format_string() == format(FORMAT_INFO[(ec_level, mask)], '015b')
+
+
+def test_format_positions():
+    # Both copies skip the timing patterns and never touch the dark module, and every position is reserved
+    for version in (1, 7, 40):
+        size = VERSIONS_DIMENSIONS[version]
+        positions = [module for pair in format_positions(version) for module in pair]
+        assert len(positions) == len(set(positions)) == 30
+        assert not {(6, 8), (8, 6), (size - 8, 8)} & set(positions)
+        assert all(reserved_modules(version)[row * size + column] for row, column in positions)
@@ -0,0 +1,94 @@
+import io
+import re
+import zlib
+
+import pytest
+
+from qrcode.core import QRCode
+from qrcode.writers import PNG_SIGNATURE, save, to_pbm, to_pgm, to_png, to_svg
+
+
+@pytest.fixture(scope='module')
+def code():
+    code = QRCode('https://example.com/' + 'x' * 80, ec_level='M')
+    code.build()
+    return code
+
+
+def scaled(matrix, scale):
+    return [[module for module in row for _ in range(scale)] for row in matrix for _ in range(scale)]
+
+
+def read_png(data):
+    # Returns the pixels of a 1-bit grayscale PNG as a matrix where 1 is black, checking every chunk
+    assert data[:8] == PNG_SIGNATURE
+    position = 8
+    compressed = b''
+    while position < len(data):
+        length = int.from_bytes(data[position:position + 4], 'big')
+        kind = data[position + 4:position + 8]
+        chunk = data[position + 8:position + 8 + length]
+        assert zlib.crc32(kind + chunk) == int.from_bytes(data[position + 8 + length:position + 12 + length], 'big')
+        if kind == b'IHDR':
+            width, height = int.from_bytes(chunk[:4], 'big'), int.from_bytes(chunk[4:8], 'big')
+            assert chunk[8:] == bytes([1, 0, 0, 0, 0])
+        elif kind == b'IDAT':
+            compressed += chunk
+        position += 12 + length
+
+    raw = zlib.decompress(compressed)
+    stride = (width + 7) // 8
+    assert all(raw[row * (stride + 1)] == 0 for row in range(height)) # Filter type None
+    return [[1 - ((raw[row * (stride + 1) + 1 + column // 8] >> (7 - column % 8)) & 1) for column in range(width)]
+            for row in range(height)]
+
+
+def read_netpbm(data, kind):
+    # Returns the pixels of a binary PBM or PGM as a matrix where 1 is black
+    header = re.match(rb'P4\n(\d+) (\d+)\n' if kind == 'pbm' else rb'P5\n(\d+) (\d+)\n255\n', data)
+    width, height = int(header[1]), int(header[2])
+    pixels = data[header.end():]
+    if kind == 'pbm':
+        stride = (width + 7) // 8
+        return [[(pixels[row * stride + column // 8] >> (7 - column % 8)) & 1 for column in range(width)]
+                for row in range(height)]
+    return [[int(pixels[row * width + column] == 0) for column in range(width)] for row in range(height)]
+
+
+def read_svg(data):
+    # Returns the modules of an SVG written by to_svg, checking that no rectangle overlaps another one
+    width = int(re.search(rb'viewBox="0 0 (\d+) ', data)[1])
+    matrix = [[0] * width for _ in range(width)]
+    for x, y, run in re.findall(rb'M(\d+) (\d+)h(\d+)v1', data):
+        for column in range(int(x), int(x) + int(run)):
+            assert matrix[int(y)][column] == 0
+            matrix[int(y)][column] = 1
+    return matrix
+
+
+@pytest.mark.parametrize('scale', [1, 3, 4])
+def test_raster_round_trip(code, scale):
+    matrix = [list(row) for row in code.matrix] # With the quiet zone
+    symbol = code.symbol()
+    assert read_png(to_png(code.matrix, scale)) == scaled(matrix, scale)
+    assert read_png(to_png(symbol, scale)) == scaled(matrix, scale)
+    assert read_png(to_png(symbol, scale, border=0)) == scaled(symbol.to_matrix(), scale)
+    assert read_netpbm(to_pbm(symbol, scale), 'pbm') == scaled(matrix, scale)
+    assert read_netpbm(to_pgm(symbol, scale, border=2), 'pgm') == scaled(
+        [row[2:-2] for row in matrix[2:-2]], scale)
+
+
+def test_svg_round_trip(code):
+    assert read_svg(to_svg(code.matrix)) == [list(row) for row in code.matrix]
+    assert read_svg(to_svg(code.symbol(), 5, border=1)) == [list(row[3:-3]) for row in code.matrix[3:-3]]
+
+
+def test_save(code, tmp_path):
+    symbol = code.symbol()
+    stream = io.BytesIO()
+    save(symbol, stream, kind='png')
+    assert stream.getvalue() == to_png(symbol)
+    save(symbol, tmp_path / 'code.svg', 2)
+    assert (tmp_path / 'code.svg').read_bytes() == to_svg(symbol, 2)
+    with pytest.raises(ValueError):
+        save(symbol, tmp_path / 'code.jpg')